@@ -0,0 +1,38 @@
+"""Add composite temperature (device_id, timestamp) index.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Replace the single-column temperature indexes with a composite one.
+
+    On MariaDB the index is built online so inserts from the telemetry
+    subscriber are not blocked while an existing table is indexed.
+    """
+    if op.get_context().dialect.name == "mysql":
+        op.execute("CREATE INDEX ix_temperature_device_id_timestamp ON temperature (device_id, timestamp) ALGORITHM=INPLACE LOCK=NONE")
+    else:
+        op.create_index("ix_temperature_device_id_timestamp", "temperature", ["device_id", "timestamp"], unique=False)
+    op.drop_index(op.f("ix_temperature_timestamp"), table_name="temperature")
+    op.drop_index(op.f("ix_temperature_device_id"), table_name="temperature")
+
+
+def downgrade() -> None:
+    """Restore the single-column temperature indexes."""
+    op.create_index(op.f("ix_temperature_device_id"), "temperature", ["device_id"], unique=False)
+    op.create_index(op.f("ix_temperature_timestamp"), "temperature", ["timestamp"], unique=False)
+    op.drop_index("ix_temperature_device_id_timestamp", table_name="temperature")
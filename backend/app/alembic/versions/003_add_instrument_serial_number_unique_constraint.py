@@ -0,0 +1,43 @@
+"""Add the unique constraint on instrument serial numbers.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Enforce unique instrument serial numbers with a single unique constraint.
+
+    The instrument table is created by the application, so the migration is a
+    no-op when the table does not exist yet or already has the constraint.
+    Existing duplicate serial numbers must be removed before upgrading.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("instrument"):
+        return
+    if any(constraint["column_names"] == ["serial_number"] for constraint in inspector.get_unique_constraints("instrument")):
+        return
+    with op.batch_alter_table("instrument") as batch_op:
+        batch_op.create_unique_constraint("uq_instrument_serial_number", ["serial_number"])
+
+
+def downgrade() -> None:
+    """Drop the unique constraint on instrument serial numbers added by this revision."""
+    inspector = sa.inspect(op.get_bind())
+    if not any(constraint["name"] == "uq_instrument_serial_number" for constraint in inspector.get_unique_constraints("instrument")):
+        return
+    with op.batch_alter_table("instrument") as batch_op:
+        batch_op.drop_constraint("uq_instrument_serial_number", type_="unique")
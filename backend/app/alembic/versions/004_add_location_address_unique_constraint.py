@@ -0,0 +1,43 @@
+"""Add the composite unique constraint on location addresses.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Enforce unique (address, postal_code, city) combinations.
+
+    The location table is created by the application, so the migration is a
+    no-op when the table does not exist yet or already has the constraint.
+    Existing duplicate locations must be removed before upgrading.
+    """
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("location"):
+        return
+    if any(constraint["name"] == "uq_location_address_postal_code_city" for constraint in inspector.get_unique_constraints("location")):
+        return
+    with op.batch_alter_table("location") as batch_op:
+        batch_op.create_unique_constraint("uq_location_address_postal_code_city", ["address", "postal_code", "city"])
+
+
+def downgrade() -> None:
+    """Drop the composite unique constraint on location addresses."""
+    inspector = sa.inspect(op.get_bind())
+    if not any(constraint["name"] == "uq_location_address_postal_code_city" for constraint in inspector.get_unique_constraints("location")):
+        return
+    with op.batch_alter_table("location") as batch_op:
+        batch_op.drop_constraint("uq_location_address_postal_code_city", type_="unique")
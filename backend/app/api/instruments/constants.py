@@ -16,12 +16,7 @@ class InstrumentBrand(Enum):
 
     def __str__(self) -> str:
         """Get the informal string representation of the instrument brand."""
-        return {
-            InstrumentBrand.ANRITSU: "Anritsu",
-            InstrumentBrand.KEYSIGHT: "Keysight",
-            InstrumentBrand.TELEDYNE_LECROY: "Teledyne LeCroy",
-            InstrumentBrand.TEKTRONIX: "Tektronix",
-        }[self]
+        return INSTRUMENT_BRAND_LABELS[self]
 
     def __repr__(self) -> str:
         """Get the official string representation of the instrument brand."""
@@ -35,7 +30,22 @@ class InstrumentBrand(Enum):
             A list of strings representing the full names of the brands.
 
         """
-        return [str(instrument_brand) for instrument_brand in InstrumentBrand]
+        return list(INSTRUMENT_BRAND_LABELS.values())
+
+
+INSTRUMENT_BRAND_LABELS: dict[InstrumentBrand, str] = {
+    InstrumentBrand.ANRITSU: "Anritsu",
+    InstrumentBrand.KEYSIGHT: "Keysight",
+    InstrumentBrand.TELEDYNE_LECROY: "Teledyne LeCroy",
+    InstrumentBrand.TEKTRONIX: "Tektronix",
+}
+"""Mapping of instrument brands to their display names, in declaration order."""
+
+INSTRUMENT_BRAND_LOOKUP: dict[str, InstrumentBrand] = {instrument_brand.value: instrument_brand for instrument_brand in InstrumentBrand}
+"""Mapping of instrument brand codes to their enum members."""
+
+INSTRUMENT_BRAND_CHOICES: str = ", ".join(InstrumentBrand.choices())
+"""Comma-separated display names of the instrument brands, as listed in error messages."""
 
 
 class InstrumentType(Enum):
@@ -52,16 +62,7 @@ class InstrumentType(Enum):
 
     def __str__(self) -> str:
         """Get the informal string representation of the instrument type."""
-        return {
-            InstrumentType.BIT_ERROR_RATE_TESTER: "Bit Error Rate Tester",
-            InstrumentType.DIGITAL_MULTIMETER: "Digital Multimeter",
-            InstrumentType.ELECTRICAL_SIGNAL_GENERATOR: "Electrical Signal Generator",
-            InstrumentType.OSCILLOSCOPE: "Oscilloscope",
-            InstrumentType.POWER_SUPPLY: "Power Supply",
-            InstrumentType.SPECTRUM_ANALYZER: "Spectrum Analyzer",
-            InstrumentType.TEMPERATURE_UNIT: "Temperature Unit",
-            InstrumentType.VECTOR_NETWORK_ANALYZER: "Vector Network Analyzer",
-        }[self]
+        return INSTRUMENT_TYPE_LABELS[self]
 
     def __repr__(self) -> str:
         """Get the official string representation of the instrument type."""
@@ -75,11 +76,33 @@ class InstrumentType(Enum):
             A list of strings representing the full names of the types.
 
         """
-        return [str(instrument_type) for instrument_type in InstrumentType]
+        return list(INSTRUMENT_TYPE_LABELS.values())
+
+
+INSTRUMENT_TYPE_LABELS: dict[InstrumentType, str] = {
+    InstrumentType.BIT_ERROR_RATE_TESTER: "Bit Error Rate Tester",
+    InstrumentType.DIGITAL_MULTIMETER: "Digital Multimeter",
+    InstrumentType.ELECTRICAL_SIGNAL_GENERATOR: "Electrical Signal Generator",
+    InstrumentType.OSCILLOSCOPE: "Oscilloscope",
+    InstrumentType.POWER_SUPPLY: "Power Supply",
+    InstrumentType.SPECTRUM_ANALYZER: "Spectrum Analyzer",
+    InstrumentType.TEMPERATURE_UNIT: "Temperature Unit",
+    InstrumentType.VECTOR_NETWORK_ANALYZER: "Vector Network Analyzer",
+}
+"""Mapping of instrument types to their display names, in declaration order."""
+
+INSTRUMENT_TYPE_LOOKUP: dict[str, InstrumentType] = {instrument_type.value: instrument_type for instrument_type in InstrumentType}
+"""Mapping of instrument type codes to their enum members."""
+
+INSTRUMENT_TYPE_CHOICES: str = ", ".join(InstrumentType.choices())
+"""Comma-separated display names of the instrument types, as listed in error messages."""
+
 
+IDENTIFIER_PATTERN = r"^[A-Za-z0-9_-]+$"
+"""Pattern shared by instrument identifiers: ASCII letters, digits, underscores and hyphens."""
 
-ModelStr = Annotated[str, Field(pattern=r"^[A-Za-z0-9_-]+$")]
+ModelStr = Annotated[str, Field(pattern=IDENTIFIER_PATTERN)]
 """Type alias for instrument model strings with validation."""
 
-SerialNumberStr = Annotated[str, Field(pattern=r"^[A-Za-z0-9_-]+$")]
+SerialNumberStr = Annotated[str, Field(pattern=IDENTIFIER_PATTERN)]
 """Type alias for instrument serial number strings with validation."""
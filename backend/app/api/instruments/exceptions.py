@@ -1,6 +1,6 @@
 """Exceptions for the API instruments module."""
 
-from .constants import InstrumentBrand, InstrumentType
+from .constants import INSTRUMENT_BRAND_CHOICES, INSTRUMENT_TYPE_CHOICES
 
 
 class InstrumentBrandError(ValueError):
@@ -13,7 +13,7 @@ class InstrumentBrandError(ValueError):
             value: The invalid brand value that was provided.
 
         """
-        message = f"Invalid instrument brand: '{value}'. Allowed: {', '.join(InstrumentBrand.choices())}."
+        message = f"Invalid instrument brand: '{value}'. Allowed: {INSTRUMENT_BRAND_CHOICES}."
         super().__init__(message)
 
 
@@ -27,7 +27,7 @@ class InstrumentTypeError(ValueError):
             value: The invalid type value that was provided.
 
         """
-        message = f"Invalid instrument type: '{value}'. Allowed: {', '.join(InstrumentType.choices())}."
+        message = f"Invalid instrument type: '{value}'. Allowed: {INSTRUMENT_TYPE_CHOICES}."
         super().__init__(message)
 
 
@@ -41,7 +41,8 @@ class InstrumentNotFoundError(Exception):
             instrument_id: The ID of the instrument that was not found.
 
         """
-        super().__init__(f"Instrument with ID {instrument_id} not found.")
+        self.detail = f"Instrument with ID {instrument_id} not found."
+        super().__init__(self.detail)
 
 
 class InstrumentAlreadyExistError(Exception):
@@ -54,4 +55,5 @@ class InstrumentAlreadyExistError(Exception):
             serial_number: The serial number that already exists.
 
         """
-        super().__init__(f"Instrument with serial number '{serial_number}' already exists.")
+        self.detail = f"Instrument with serial number '{serial_number}' already exists."
+        super().__init__(self.detail)
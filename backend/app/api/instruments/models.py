@@ -2,7 +2,7 @@
 
 from sqlmodel import Field
 
-from .constants import SerialNumberStr
+from .constants import IDENTIFIER_PATTERN
 from .schemas import InstrumentBase
 
 
@@ -19,4 +19,6 @@ class Instrument(InstrumentBase, table=True):
     """
 
     id: int | None = Field(default=None, primary_key=True)
-    serial_number: SerialNumberStr = Field(index=True, unique=True)
+    # Not annotated with SerialNumberStr: pydantic replaces the SQLModel field info when the annotation carries
+    # its own Field, which silently dropped the unique constraint. A single UNIQUE constraint also serves lookups.
+    serial_number: str = Field(unique=True, schema_extra={"pattern": IDENTIFIER_PATTERN})
@@ -1,6 +1,6 @@
 """API routes for the API instruments module."""
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from app.api.instruments.exceptions import (
     InstrumentAlreadyExistError,
@@ -11,15 +11,23 @@ from app.api.instruments.schemas import (
     InstrumentRead,
     InstrumentUpdate,
 )
-from app.api.instruments.services import InstrumentService
+from app.api.instruments.services import INSTRUMENT_READ_ADAPTER, INSTRUMENT_READ_LIST_ADAPTER, InstrumentService
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.etag import json_response_with_etag
 from app.db import get_session
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from loguru import logger
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 router_collection: APIRouter = APIRouter(prefix="/instruments", tags=["instruments"])
 router_resource: APIRouter = APIRouter(prefix="/instrument", tags=["instrument"])
 
+NOT_FOUND_RESPONSES: dict[int | str, dict[str, Any]] = {status.HTTP_404_NOT_FOUND: {"description": "Instrument not found"}}
+"""OpenAPI description of the 404 returned by the routes addressing a single instrument."""
+
+CONFLICT_RESPONSES: dict[int | str, dict[str, Any]] = {status.HTTP_409_CONFLICT: {"description": "Instrument serial number already exists"}}
+"""OpenAPI description of the 409 returned by the routes writing a serial number."""
+
 
 async def get_instrument_service(
     session: Annotated[AsyncSession, Depends(get_session)],
@@ -36,7 +44,7 @@ async def get_instrument_service(
     return InstrumentService(session=session)
 
 
-@router_resource.post("/", status_code=status.HTTP_201_CREATED)
+@router_resource.post("/", status_code=status.HTTP_201_CREATED, responses=CONFLICT_RESPONSES)
 async def create_instrument(
     instrument_data: InstrumentCreate,
     service: Annotated[InstrumentService, Depends(get_instrument_service)],
@@ -57,38 +65,42 @@ async def create_instrument(
     try:
         return await service.create(instrument_data)
     except InstrumentAlreadyExistError as e:
-        detail = str(e)
-        logger.warning(f"Create instrument failed due to conflict: {detail}")
+        detail = e.detail
+        logger.warning("Create instrument failed due to conflict: {}", detail)
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail) from e
 
 
-@router_resource.get("/{instrument_id}")
+@router_resource.get("/{instrument_id}", response_model=InstrumentRead, responses=NOT_FOUND_RESPONSES)
 async def get_instrument(
     instrument_id: int,
     service: Annotated[InstrumentService, Depends(get_instrument_service)],
-) -> InstrumentRead:
+    request: Request,
+) -> Response:
     """Get an instrument by its ID.
 
     Args:
         instrument_id: The ID of the instrument to retrieve.
         service: The instrument service dependency.
+        request: The incoming request, checked for an If-None-Match header.
 
     Returns:
-        The requested instrument.
+        The requested instrument with its ETag, or a 304 if the client copy is current.
 
     Raises:
         HTTPException: If the instrument is not found.
 
     """
     try:
-        return await service.get(instrument_id)
+        instrument = await service.get(instrument_id)
     except InstrumentNotFoundError as e:
-        detail = str(e)
-        logger.warning(f"Get instrument failed: {detail}")
+        detail = e.detail
+        logger.warning("Get instrument failed: {}", detail)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from e
+    else:
+        return json_response_with_etag(request, INSTRUMENT_READ_ADAPTER.dump_json(instrument))
 
 
-@router_resource.patch("/{instrument_id}")
+@router_resource.patch("/{instrument_id}", responses=NOT_FOUND_RESPONSES | CONFLICT_RESPONSES)
 async def update_instrument(
     instrument_id: int,
     instrument_data: InstrumentUpdate,
@@ -111,16 +123,16 @@ async def update_instrument(
     try:
         return await service.update(instrument_id, instrument_data)
     except InstrumentNotFoundError as e:
-        detail = str(e)
-        logger.warning(f"Update instrument failed, not found: {detail}")
+        detail = e.detail
+        logger.warning("Update instrument failed, not found: {}", detail)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from e
     except InstrumentAlreadyExistError as e:
-        detail = str(e)
-        logger.warning(f"Update instrument failed, conflict: {detail}")
+        detail = e.detail
+        logger.warning("Update instrument failed, conflict: {}", detail)
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail) from e
 
 
-@router_resource.delete("/{instrument_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router_resource.delete("/{instrument_id}", status_code=status.HTTP_204_NO_CONTENT, responses=NOT_FOUND_RESPONSES)
 async def delete_instrument(
     instrument_id: int,
     service: Annotated[InstrumentService, Depends(get_instrument_service)],
@@ -138,22 +150,56 @@ async def delete_instrument(
     try:
         await service.delete(instrument_id)
     except InstrumentNotFoundError as e:
-        detail = str(e)
-        logger.warning(f"Delete instrument failed: {detail}")
+        detail = e.detail
+        logger.warning("Delete instrument failed: {}", detail)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from e
 
 
-@router_collection.get("/")
-async def gets_instruments(
+@router_collection.post("/", status_code=status.HTTP_201_CREATED, responses=CONFLICT_RESPONSES)
+async def create_instruments(
+    instruments_data: list[InstrumentCreate],
     service: Annotated[InstrumentService, Depends(get_instrument_service)],
 ) -> list[InstrumentRead]:
-    """List all instruments.
+    """Create several instruments at once.
+
+    Args:
+        instruments_data: The instrument data for creation.
+        service: The instrument service dependency.
+
+    Returns:
+        The created instruments with their database IDs.
+
+    Raises:
+        HTTPException: If one of the serial numbers already exists or is repeated.
+
+    """
+    try:
+        return await service.create_many(instruments_data)
+    except InstrumentAlreadyExistError as e:
+        detail = e.detail
+        logger.warning("Create instruments failed due to conflict: {}", detail)
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail) from e
+
+
+@router_collection.get("/", response_model=list[InstrumentRead])
+async def gets_instruments(
+    service: Annotated[InstrumentService, Depends(get_instrument_service)],
+    request: Request,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[int | None, Query(ge=0)] = None,
+) -> Response:
+    """List instruments, one page at a time.
 
     Args:
         service: The instrument service dependency.
+        request: The incoming request, checked for an If-None-Match header.
+        limit: The maximum number of instruments to return.
+        cursor: The ID of the last instrument of the previous page.
 
     Returns:
-        A list of all instruments.
+        A JSON response with the instruments ordered by ID and its ETag,
+        or a 304 if the client copy is current.
 
     """
-    return await service.gets()
+    instruments = await service.gets(limit=limit, cursor=cursor)
+    return json_response_with_etag(request, INSTRUMENT_READ_LIST_ADAPTER.dump_json(instruments))
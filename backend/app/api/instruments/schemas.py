@@ -1,12 +1,39 @@
 """Schemas for the API instruments module."""
 
+from collections.abc import Mapping
+from enum import Enum
+
 from pydantic import field_validator
 from sqlmodel import Field, SQLModel
 
-from .constants import InstrumentBrand, InstrumentType, ModelStr, SerialNumberStr
+from .constants import INSTRUMENT_BRAND_LOOKUP, INSTRUMENT_TYPE_LOOKUP, InstrumentBrand, InstrumentType, ModelStr, SerialNumberStr
 from .exceptions import InstrumentBrandError, InstrumentTypeError
 
 
+def _coerce_enum[EnumT: Enum](value: object, enum_cls: type[EnumT], lookup: Mapping[str, EnumT], error_cls: type[ValueError]) -> EnumT:
+    """Convert a raw value to a member of an enum using its cached lookup table.
+
+    Args:
+        value: The input value, which can be a string or a member of the enum.
+        enum_cls: The enum class to convert to.
+        lookup: The mapping of enum values to enum members.
+        error_cls: The exception raised when the value is not a valid member.
+
+    Returns:
+        The corresponding enum member.
+
+    Raises:
+        ValueError: An instance of error_cls if the value is not a valid member.
+
+    """
+    if isinstance(value, enum_cls):
+        return value
+    member = lookup.get(value) if isinstance(value, str) else None
+    if member is None:
+        raise error_cls(str(value))
+    return member
+
+
 class InstrumentBase(SQLModel):
     """Base schema for an instrument with shared fields and validation."""
 
@@ -30,12 +57,7 @@ class InstrumentBase(SQLModel):
             InstrumentBrandError: If the value is not a valid brand.
 
         """
-        if isinstance(value, InstrumentBrand):
-            return value
-        try:
-            return InstrumentBrand(value)
-        except ValueError as e:
-            raise InstrumentBrandError(str(value)) from e
+        return _coerce_enum(value, InstrumentBrand, INSTRUMENT_BRAND_LOOKUP, InstrumentBrandError)
 
     @field_validator("type", mode="before")
     @classmethod
@@ -52,12 +74,7 @@ class InstrumentBase(SQLModel):
             InstrumentTypeError: If the value is not a valid type.
 
         """
-        if isinstance(value, InstrumentType):
-            return value
-        try:
-            return InstrumentType(value)
-        except ValueError as e:
-            raise InstrumentTypeError(str(value)) from e
+        return _coerce_enum(value, InstrumentType, INSTRUMENT_TYPE_LOOKUP, InstrumentTypeError)
 
 
 class InstrumentCreate(InstrumentBase):
@@ -90,12 +107,9 @@ class InstrumentUpdate(SQLModel):
             InstrumentBrandError: If the value is not a valid brand.
 
         """
-        if isinstance(value, InstrumentBrand) or value is None:
-            return value
-        try:
-            return InstrumentBrand(value)
-        except ValueError as e:
-            raise InstrumentBrandError(str(value)) from e
+        if value is None:
+            return None
+        return _coerce_enum(value, InstrumentBrand, INSTRUMENT_BRAND_LOOKUP, InstrumentBrandError)
 
     @field_validator("type", mode="before")
     @classmethod
@@ -112,12 +126,9 @@ class InstrumentUpdate(SQLModel):
             InstrumentTypeError: If the value is not a valid type.
 
         """
-        if isinstance(value, InstrumentType) or value is None:
-            return value
-        try:
-            return InstrumentType(value)
-        except ValueError as e:
-            raise InstrumentTypeError(str(value)) from e
+        if value is None:
+            return None
+        return _coerce_enum(value, InstrumentType, INSTRUMENT_TYPE_LOOKUP, InstrumentTypeError)
 
 
 class InstrumentRead(InstrumentBase):
@@ -10,11 +10,24 @@ from app.api.instruments.schemas import (
     InstrumentRead,
     InstrumentUpdate,
 )
+from app.core.constants import DEFAULT_PAGE_SIZE
 from loguru import logger
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, update
+from sqlalchemy import select as sa_select
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+INSTRUMENT_READ_ADAPTER = TypeAdapter(InstrumentRead)
+"""Cached validator used to serialize a single instrument row."""
+
+INSTRUMENT_READ_LIST_ADAPTER = TypeAdapter(list[InstrumentRead])
+"""Cached validator used to serialize a list of instrument rows in one pass."""
+
+INSTRUMENT_READ_COLUMNS = (col(Instrument.id), col(Instrument.brand), col(Instrument.type), col(Instrument.model), col(Instrument.serial_number))
+"""Columns selected when listing instruments, so that pages are read as plain rows without ORM hydration."""
+
 
 class InstrumentService:
     """Encapsulates CRUD operations for the Instrument model."""
@@ -27,7 +40,7 @@ class InstrumentService:
 
         """
         self.session = session
-        logger.debug(f"InstrumentService initialized with async session: {session}")
+        logger.debug("InstrumentService initialized with async session: {}", session)
 
     async def create(self, instrument_data: InstrumentCreate) -> InstrumentRead:
         """Create a new instrument in the database.
@@ -44,16 +57,84 @@ class InstrumentService:
 
         """
         try:
-            instrument = Instrument.model_validate(instrument_data)
-            self.session.add(instrument)
+            # RETURNING hands back the generated ID with the insert, no refresh round trip is needed
+            statement = insert(Instrument).values(**instrument_data.model_dump()).returning(Instrument)
+            result = await self.session.exec(statement)
+            instrument = INSTRUMENT_READ_ADAPTER.validate_python(result.scalar_one(), from_attributes=True)
             await self.session.commit()
-            await self.session.refresh(instrument)
-            logger.info(f"Created instrument with serial number: {instrument.serial_number}")
-            return InstrumentRead.model_validate(instrument)
         except IntegrityError as e:
             await self.session.rollback()
-            logger.error(f"Failed to create instrument: {e}")
+            logger.error("Failed to create instrument: {}", e)
             raise InstrumentAlreadyExistError(instrument_data.serial_number) from e
+        else:
+            logger.info("Created instrument with serial number: {}", instrument.serial_number)
+            return instrument
+
+    async def create_many(self, instruments_data: list[InstrumentCreate]) -> list[InstrumentRead]:
+        """Create several instruments in a single statement and transaction.
+
+        Args:
+            instruments_data: The data for the new instruments.
+
+        Returns:
+            The newly created instruments with their database IDs, in input order.
+
+        Raises:
+            InstrumentAlreadyExistError: If one of the serial numbers already
+                exists or is repeated in the batch. No instrument is created.
+
+        """
+        if not instruments_data:
+            return []
+        try:
+            statement = insert(Instrument).returning(Instrument, sort_by_parameter_order=True)
+            result = await self.session.exec(statement, params=[instrument_data.model_dump() for instrument_data in instruments_data])
+            instruments = INSTRUMENT_READ_LIST_ADAPTER.validate_python(result.scalars().all(), from_attributes=True)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.error("Failed to create instruments: {}", e)
+            raise InstrumentAlreadyExistError(await self._find_duplicate_serial_number(instruments_data)) from e
+        else:
+            logger.info("Created {} instruments", len(instruments))
+            return instruments
+
+    async def _is_serial_number_taken(self, serial_number: str, instrument_id: int) -> bool:
+        """Check whether a serial number is already used by another instrument.
+
+        Args:
+            serial_number: The serial number to look up.
+            instrument_id: The ID of the instrument allowed to hold the serial number.
+
+        Returns:
+            True if an instrument other than instrument_id holds the serial number.
+
+        """
+        statement = select(Instrument.id).where(col(Instrument.serial_number) == serial_number, col(Instrument.id) != instrument_id).limit(1)
+        result = await self.session.exec(statement)
+        return result.first() is not None
+
+    async def _find_duplicate_serial_number(self, instruments_data: list[InstrumentCreate]) -> str:
+        """Find the serial number that made a batch insert violate the unique constraint.
+
+        Args:
+            instruments_data: The data of the rejected batch.
+
+        Returns:
+            A serial number that already exists in the database or is repeated in the batch.
+
+        """
+        serial_numbers = [instrument_data.serial_number for instrument_data in instruments_data]
+        result = await self.session.exec(select(Instrument.serial_number).where(col(Instrument.serial_number).in_(serial_numbers)).limit(1))
+        existing = result.first()
+        if existing is not None:
+            return existing
+        seen: set[str] = set()
+        for serial_number in serial_numbers:
+            if serial_number in seen:
+                return serial_number
+            seen.add(serial_number)
+        return ""
 
     async def get(self, instrument_id: int) -> InstrumentRead:
         """Retrieve an instrument by its ID.
@@ -68,14 +149,12 @@ class InstrumentService:
             InstrumentNotFoundError: If the instrument is not found.
 
         """
-        query = select(Instrument).where(Instrument.id == instrument_id)
-        result = await self.session.exec(query)
-        instrument = result.one_or_none()
-        if not instrument:
-            logger.warning(f"Instrument with ID {instrument_id} not found")
+        instrument = await self.session.get(Instrument, instrument_id)
+        if instrument is None:
+            logger.warning("Instrument with ID {} not found", instrument_id)
             raise InstrumentNotFoundError(instrument_id)
-        logger.debug(f"Retrieved instrument with ID {instrument_id}")
-        return InstrumentRead.model_validate(instrument)
+        logger.debug("Retrieved instrument with ID {}", instrument_id)
+        return INSTRUMENT_READ_ADAPTER.validate_python(instrument, from_attributes=True)
 
     async def update(self, instrument_id: int, instrument_data: InstrumentUpdate) -> InstrumentRead:
         """Update an existing instrument.
@@ -91,30 +170,40 @@ class InstrumentService:
             InstrumentNotFoundError: If the instrument is not found.
             InstrumentAlreadyExistError: If the serial number is changed to one
                 that already exists.
+            IntegrityError: If the update violates another database constraint.
 
         """
-        query = select(Instrument).where(Instrument.id == instrument_id)
-        result = await self.session.exec(query)
-        db_instrument = result.one_or_none()
-        if not db_instrument:
-            logger.warning(f"Instrument with ID {instrument_id} not found for update")
-            raise InstrumentNotFoundError(instrument_id)
-
-        # Update only the fields that were provided
-        update_data = instrument_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(db_instrument, key, value)
+        # Read only the fields sent by the client, in declaration order so the statement shape is stable
+        update_data = {name: getattr(instrument_data, name) for name in type(instrument_data).model_fields if name in instrument_data.model_fields_set}
+        if not update_data:
+            return await self.get(instrument_id)
 
+        statement = update(Instrument).where(col(Instrument.id) == instrument_id).values(**update_data)
         try:
-            self.session.add(db_instrument)
-            await self.session.commit()
-            await self.session.refresh(db_instrument)
-            logger.info(f"Updated instrument with ID {instrument_id}")
-            return InstrumentRead.model_validate(db_instrument)
+            if self.session.get_bind().dialect.update_returning:
+                result = await self.session.exec(statement.returning(Instrument))
+                db_instrument = result.scalar_one_or_none()
+            else:
+                # MariaDB has no UPDATE ... RETURNING, read the row back in the same transaction instead
+                result = await self.session.exec(statement)
+                db_instrument = await self.session.get(Instrument, instrument_id, populate_existing=True) if result.rowcount else None
         except IntegrityError as e:
             await self.session.rollback()
-            logger.error(f"Failed to update instrument with ID {instrument_id}: {e}")
-            raise InstrumentAlreadyExistError(db_instrument.serial_number) from e
+            logger.error("Failed to update instrument with ID {}: {}", instrument_id, e)
+            # Only a serial number held by another instrument is a conflict, other violations are not
+            serial_number = update_data.get("serial_number")
+            if serial_number is None or not await self._is_serial_number_taken(serial_number, instrument_id):
+                raise
+            raise InstrumentAlreadyExistError(serial_number) from e
+
+        if db_instrument is None:
+            logger.warning("Instrument with ID {} not found for update", instrument_id)
+            raise InstrumentNotFoundError(instrument_id)
+
+        instrument = INSTRUMENT_READ_ADAPTER.validate_python(db_instrument, from_attributes=True)
+        await self.session.commit()
+        logger.info("Updated instrument with ID {}", instrument_id)
+        return instrument
 
     async def delete(self, instrument_id: int) -> None:
         """Delete an instrument by its ID.
@@ -126,26 +215,31 @@ class InstrumentService:
             InstrumentNotFoundError: If the instrument is not found.
 
         """
-        query = select(Instrument).where(Instrument.id == instrument_id)
-        result = await self.session.exec(query)
-        instrument = result.one_or_none()
-        if not instrument:
-            logger.warning(f"Instrument with ID {instrument_id} not found for deletion")
+        statement = delete(Instrument).where(col(Instrument.id) == instrument_id).returning(col(Instrument.id))
+        result = await self.session.exec(statement)
+        if result.first() is None:
+            logger.warning("Instrument with ID {} not found for deletion", instrument_id)
             raise InstrumentNotFoundError(instrument_id)
 
-        await self.session.delete(instrument)
         await self.session.commit()
-        logger.info(f"Deleted instrument with ID {instrument_id}")
+        logger.info("Deleted instrument with ID {}", instrument_id)
 
-    async def gets(self) -> list[InstrumentRead]:
-        """Retrieve all instruments from the database.
+    async def gets(self, limit: int = DEFAULT_PAGE_SIZE, cursor: int | None = None) -> list[InstrumentRead]:
+        """Retrieve a page of instruments from the database, ordered by ID.
+
+        Args:
+            limit: The maximum number of instruments to return.
+            cursor: Only return instruments with an ID greater than this value.
 
         Returns:
-            A list of all instruments.
+            A list of instruments.
 
         """
-        query = select(Instrument)
-        result = await self.session.exec(query)
+        query = sa_select(*INSTRUMENT_READ_COLUMNS).order_by(col(Instrument.id)).limit(limit)
+        if cursor is not None:
+            query = query.where(col(Instrument.id) > cursor)
+        # SQLModel's exec() overloads only cover its own select(), which is typed for up to four columns
+        result = await self.session.exec(query)  # type: ignore[call-overload]
         instruments = result.all()
-        logger.debug(f"Retrieved {len(instruments)} instruments")
-        return [InstrumentRead.model_validate(instrument) for instrument in instruments]
+        logger.debug("Retrieved {} instruments", len(instruments))
+        return INSTRUMENT_READ_LIST_ADAPTER.validate_python(instruments, from_attributes=True)
@@ -1,5 +1,6 @@
 """Models for the API locations module."""
 
+from sqlalchemy import UniqueConstraint
 from sqlmodel import Field
 
 from .schemas import LocationBase
@@ -19,4 +20,6 @@ class Location(LocationBase, table=True):
 
     """
 
+    __table_args__ = (UniqueConstraint("address", "postal_code", "city", name="uq_location_address_postal_code_city"),)
+
     id: int | None = Field(default=None, primary_key=True)
@@ -7,9 +7,12 @@ from app.api.locations.exceptions import (
     LocationNotFoundError,
 )
 from app.api.locations.schemas import LocationCreate, LocationRead, LocationUpdate
-from app.api.locations.services import LocationService
+from app.api.locations.services import LOCATION_READ_LIST_ADAPTER, LocationService
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.etag import json_response_with_etag
 from app.db import get_session
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -54,7 +57,7 @@ async def create_location(
         return await service.create(location_data)
     except LocationAlreadyExistError as e:
         detail = str(e)
-        logger.warning(f"Create location failed: {detail}")
+        logger.warning("Create location failed: {}", detail)
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail) from e
 
 
@@ -80,7 +83,7 @@ async def get_location(
         return await service.get(location_id)
     except LocationNotFoundError as e:
         detail = str(e)
-        logger.warning(f"Get location failed: {detail}")
+        logger.warning("Get location failed: {}", detail)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from e
 
 
@@ -109,11 +112,11 @@ async def update_location(
         return await service.update(location_id, location_data)
     except LocationNotFoundError as e:
         detail = str(e)
-        logger.warning(f"Update location failed: {detail}")
+        logger.warning("Update location failed: {}", detail)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from e
     except LocationAlreadyExistError as e:
         detail = str(e)
-        logger.warning(f"Update location failed due to conflict: {detail}")
+        logger.warning("Update location failed due to conflict: {}", detail)
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail) from e
 
 
@@ -136,21 +139,47 @@ async def delete_location(
         await service.delete(location_id)
     except LocationNotFoundError as e:
         detail = str(e)
-        logger.warning(f"Delete location failed: {detail}")
+        logger.warning("Delete location failed: {}", detail)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from e
 
 
-@router_collection.get("/")
+@router_collection.get("/", response_model=list[LocationRead])
 async def get_locations(
     service: Annotated[LocationService, Depends(get_location_service)],
-) -> list[LocationRead]:
-    """Retrieve all locations.
+    request: Request,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[int | None, Query(ge=0)] = None,
+) -> Response:
+    """Retrieve locations, one page at a time.
 
     Args:
         service: The location service dependency.
+        request: The incoming request, checked for an If-None-Match header.
+        limit: The maximum number of locations to return.
+        cursor: The ID of the last location of the previous page.
 
     Returns:
-        A list of all locations.
+        A JSON response with the locations ordered by ID and its ETag,
+        or a 304 if the client copy is current.
 
     """
-    return await service.gets()
+    locations = await service.gets(limit=limit, cursor=cursor)
+    return json_response_with_etag(request, LOCATION_READ_LIST_ADAPTER.dump_json(locations))
+
+
+@router_collection.get("/stream", response_class=StreamingResponse)
+async def stream_locations(
+    service: Annotated[LocationService, Depends(get_location_service)],
+    cursor: Annotated[int | None, Query(ge=0)] = None,
+) -> StreamingResponse:
+    """Stream every location as newline-delimited JSON.
+
+    Args:
+        service: The location service dependency.
+        cursor: Only stream locations with an ID greater than this value.
+
+    Returns:
+        A streaming response with one location per line, ordered by ID.
+
+    """
+    return StreamingResponse(service.stream(cursor=cursor), media_type="application/x-ndjson")
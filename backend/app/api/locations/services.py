@@ -1,16 +1,27 @@
 """Services for the API locations module."""
 
+from collections.abc import AsyncIterator
+
 from app.api.locations.exceptions import (
     LocationAlreadyExistError,
     LocationNotFoundError,
 )
 from app.api.locations.models import Location
 from app.api.locations.schemas import LocationCreate, LocationRead, LocationUpdate
+from app.core.constants import DEFAULT_PAGE_SIZE, STREAM_BATCH_SIZE
 from loguru import logger
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, update
 from sqlalchemy.exc import IntegrityError
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+LOCATION_READ_ADAPTER = TypeAdapter(LocationRead)
+"""Cached validator used to serialize a single location row."""
+
+LOCATION_READ_LIST_ADAPTER = TypeAdapter(list[LocationRead])
+"""Cached validator used to serialize a list of location rows in one pass."""
+
 
 class LocationService:
     """Encapsulates CRUD operations for the Location model."""
@@ -23,7 +34,7 @@ class LocationService:
 
         """
         self.session = session
-        logger.debug(f"LocationService initialized with async session: {session}")
+        logger.debug("LocationService initialized with async session: {}", session)
 
     async def create(self, location_data: LocationCreate) -> LocationRead:
         """Create a new location in the database.
@@ -40,18 +51,20 @@ class LocationService:
 
         """
         try:
-            location = Location.model_validate(location_data)
-            self.session.add(location)
+            # RETURNING hands back the generated ID with the insert, no refresh round trip is needed
+            statement = insert(Location).values(**location_data.model_dump()).returning(Location)
+            result = await self.session.exec(statement)
+            location = LOCATION_READ_ADAPTER.validate_python(result.scalar_one(), from_attributes=True)
             await self.session.commit()
-            await self.session.refresh(location)
-            logger.info(f"Created location with ID: {location.id}")
-            return LocationRead.model_validate(location)
         except IntegrityError as e:
             await self.session.rollback()
-            logger.error(f"Failed to create location: {e}")
+            logger.error("Failed to create location: {}", e)
             # Include address, postal_code, and city in error message to identify the composite key
             location_identifier = f"{location_data.address}, {location_data.postal_code}, {location_data.city}"
             raise LocationAlreadyExistError(location_identifier) from e
+        else:
+            logger.info("Created location with ID: {}", location.id)
+            return location
 
     async def get(self, location_id: int) -> LocationRead:
         """Retrieve a location by its ID.
@@ -66,14 +79,12 @@ class LocationService:
             LocationNotFoundError: If no location with the given ID exists.
 
         """
-        query = select(Location).where(Location.id == location_id)
-        result = await self.session.exec(query)
-        location = result.one_or_none()
-        if not location:
-            logger.warning(f"Location with ID {location_id} not found.")
+        location = await self.session.get(Location, location_id)
+        if location is None:
+            logger.warning("Location with ID {} not found.", location_id)
             raise LocationNotFoundError(location_id)
-        logger.debug(f"Retrieved location with ID: {location_id}")
-        return LocationRead.model_validate(location)
+        logger.debug("Retrieved location with ID: {}", location_id)
+        return LOCATION_READ_ADAPTER.validate_python(location, from_attributes=True)
 
     async def update(self, location_id: int, location_data: LocationUpdate) -> LocationRead:
         """Update an existing location in the database.
@@ -91,33 +102,41 @@ class LocationService:
                 address, postal_code, and city combination.
 
         """
-        query = select(Location).where(Location.id == location_id)
-        result = await self.session.exec(query)
-        location = result.one_or_none()
-        if not location:
-            logger.warning(f"Location with ID {location_id} not found for update.")
-            raise LocationNotFoundError(location_id)
-
-        update_data = location_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(location, key, value)
+        # Read only the fields sent by the client, in declaration order so the statement shape is stable
+        update_data = {name: getattr(location_data, name) for name in type(location_data).model_fields if name in location_data.model_fields_set}
+        if not update_data:
+            logger.debug("No changes requested for location with ID: {}", location_id)
+            return await self.get(location_id)
 
+        statement = update(Location).where(col(Location.id) == location_id).values(**update_data)
         try:
-            self.session.add(location)
-            await self.session.commit()
-            await self.session.refresh(location)
-            logger.info(f"Updated location with ID: {location_id}")
-            return LocationRead.model_validate(location)
+            if self.session.get_bind().dialect.update_returning:
+                result = await self.session.exec(statement.returning(Location))
+                location = result.scalar_one_or_none()
+            else:
+                # MariaDB has no UPDATE ... RETURNING, read the row back in the same transaction instead
+                result = await self.session.exec(statement)
+                location = await self.session.get(Location, location_id, populate_existing=True) if result.rowcount else None
         except IntegrityError as e:
             await self.session.rollback()
-            logger.error(f"Failed to update location with ID {location_id}: {e}")
-            # Include composite key components in error message
-            address = update_data.get("address", location.address)
-            postal_code = update_data.get("postal_code", location.postal_code)
-            city = update_data.get("city", location.city)
+            logger.error("Failed to update location with ID {}: {}", location_id, e)
+            # Include composite key components in error message, completing the update with the stored values
+            stored_location = await self.session.get(Location, location_id)
+            address = update_data.get("address", getattr(stored_location, "address", ""))
+            postal_code = update_data.get("postal_code", getattr(stored_location, "postal_code", ""))
+            city = update_data.get("city", getattr(stored_location, "city", ""))
             location_identifier = f"{address}, {postal_code}, {city}"
             raise LocationAlreadyExistError(location_identifier) from e
 
+        if location is None:
+            logger.warning("Location with ID {} not found for update.", location_id)
+            raise LocationNotFoundError(location_id)
+
+        location_read = LOCATION_READ_ADAPTER.validate_python(location, from_attributes=True)
+        await self.session.commit()
+        logger.info("Updated location with ID: {}", location_id)
+        return location_read
+
     async def delete(self, location_id: int) -> None:
         """Delete a location from the database.
 
@@ -128,26 +147,50 @@ class LocationService:
             LocationNotFoundError: If no location with the given ID exists.
 
         """
-        query = select(Location).where(Location.id == location_id)
-        result = await self.session.exec(query)
-        location = result.one_or_none()
-        if not location:
-            logger.warning(f"Location with ID {location_id} not found for deletion.")
+        statement = delete(Location).where(col(Location.id) == location_id).returning(col(Location.id))
+        result = await self.session.exec(statement)
+        if result.first() is None:
+            logger.warning("Location with ID {} not found for deletion.", location_id)
             raise LocationNotFoundError(location_id)
 
-        await self.session.delete(location)
         await self.session.commit()
-        logger.info(f"Deleted location with ID: {location_id}")
+        logger.info("Deleted location with ID: {}", location_id)
+
+    async def gets(self, limit: int = DEFAULT_PAGE_SIZE, cursor: int | None = None) -> list[LocationRead]:
+        """Retrieve a page of locations from the database, ordered by ID.
 
-    async def gets(self) -> list[LocationRead]:
-        """Retrieve all locations from the database.
+        Args:
+            limit: The maximum number of locations to return.
+            cursor: Only return locations with an ID greater than this value.
 
         Returns:
-            A list of all locations.
+            A list of locations.
 
         """
-        query = select(Location)
+        query = select(Location).order_by(col(Location.id)).limit(limit)
+        if cursor is not None:
+            query = query.where(col(Location.id) > cursor)
         result = await self.session.exec(query)
         locations = result.all()
-        logger.info(f"Retrieved {len(locations)} locations from the database.")
-        return [LocationRead.model_validate(location) for location in locations]
+        logger.info("Retrieved {} locations from the database.", len(locations))
+        return LOCATION_READ_LIST_ADAPTER.validate_python(locations, from_attributes=True)
+
+    async def stream(self, cursor: int | None = None) -> AsyncIterator[bytes]:
+        """Stream all locations as newline-delimited JSON, ordered by ID.
+
+        Rows are fetched in batches of STREAM_BATCH_SIZE, so memory usage does not
+        grow with the size of the location table.
+
+        Args:
+            cursor: Only stream locations with an ID greater than this value.
+
+        Yields:
+            One JSON-encoded location per line.
+
+        """
+        query = select(Location).order_by(col(Location.id)).execution_options(yield_per=STREAM_BATCH_SIZE)
+        if cursor is not None:
+            query = query.where(col(Location.id) > cursor)
+        result = await self.session.stream_scalars(query)
+        async for location in result:
+            yield LOCATION_READ_ADAPTER.dump_json(LOCATION_READ_ADAPTER.validate_python(location, from_attributes=True)) + b"\n"
@@ -1,7 +1,8 @@
 """Models for the temperature module."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
+from sqlalchemy import Index
 from sqlmodel import Field
 
 from .schemas import TemperatureBase
@@ -22,6 +23,7 @@ class Temperature(TemperatureBase, table=True):
     """
 
     __tablename__ = "temperature"
+    __table_args__ = (Index("ix_temperature_device_id_timestamp", "device_id", "timestamp"),)
 
     id: int | None = Field(default=None, primary_key=True)
-    timestamp: datetime = Field(default_factory=datetime.utcnow, index=True)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
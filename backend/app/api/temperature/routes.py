@@ -2,14 +2,17 @@
 
 from typing import Annotated
 
+from app.core.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.core.etag import json_response_with_etag
 from app.db import get_session
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .exceptions import TemperatureNotFoundError
-from .schemas import TemperatureCreate, TemperatureRead
-from .services import TemperatureService
+from .schemas import TemperatureCreate, TemperatureFilter, TemperatureRead
+from .services import TEMPERATURE_READ_ADAPTER, TEMPERATURE_READ_LIST_ADAPTER, TemperatureService
 
 router_collection: APIRouter = APIRouter(prefix="/temperatures", tags=["temperatures"])
 router_resource: APIRouter = APIRouter(prefix="/temperature", tags=["temperature"])
@@ -45,34 +48,37 @@ async def create_temperature(
         The created temperature record with its database ID and timestamp.
 
     """
-    temperature = await service.create(temperature_data)
-    return TemperatureRead.model_validate(temperature)
+    return await service.create(temperature_data)
 
 
-@router_resource.get("/{temperature_id}")
+@router_resource.get("/{temperature_id}", response_model=TemperatureRead)
 async def get_temperature(
     temperature_id: int,
     service: Annotated[TemperatureService, Depends(get_temperature_service)],
-) -> TemperatureRead:
+    request: Request,
+) -> Response:
     """Retrieve a temperature record by its ID.
 
     Args:
         temperature_id: The ID of the temperature record to retrieve.
         service: The temperature service dependency.
+        request: The incoming request, checked for an If-None-Match header.
 
     Returns:
-        The requested temperature record.
+        The requested temperature record with its ETag, or a 304 if the client copy is current.
 
     Raises:
         HTTPException: If the temperature record is not found.
 
     """
     try:
-        return await service.get(temperature_id)
+        temperature = await service.get(temperature_id)
     except TemperatureNotFoundError as e:
         detail = str(e)
-        logger.warning(f"Get temperature failed: {detail}")
+        logger.warning("Get temperature failed: {}", detail)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from e
+    else:
+        return json_response_with_etag(request, TEMPERATURE_READ_ADAPTER.dump_json(temperature))
 
 
 @router_resource.delete("/{temperature_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -94,13 +100,67 @@ async def delete_temperature(
         await service.delete(temperature_id)
     except TemperatureNotFoundError as e:
         detail = str(e)
-        logger.warning(f"Delete temperature failed: {detail}")
+        logger.warning("Delete temperature failed: {}", detail)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail) from e
 
 
-@router_collection.get("/")
-async def gets_temperatures(
+@router_collection.post("/", status_code=status.HTTP_201_CREATED)
+async def create_temperatures(
+    temperatures_data: list[TemperatureCreate],
     service: Annotated[TemperatureService, Depends(get_temperature_service)],
 ) -> list[TemperatureRead]:
-    """List all temperature records."""
-    return await service.gets()
+    """Create several temperature records at once.
+
+    Args:
+        temperatures_data: The temperature data for creation.
+        service: The temperature service dependency.
+
+    Returns:
+        The created temperature records with their database IDs.
+
+    """
+    return await service.create_many(temperatures_data)
+
+
+@router_collection.get("/", response_model=list[TemperatureRead])
+async def gets_temperatures(
+    service: Annotated[TemperatureService, Depends(get_temperature_service)],
+    request: Request,
+    filters: Annotated[TemperatureFilter, Depends()],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[int | None, Query(ge=0)] = None,
+) -> Response:
+    """List temperature records, one page at a time.
+
+    Args:
+        service: The temperature service dependency.
+        request: The incoming request, checked for an If-None-Match header.
+        filters: The device and time range filters, applied in the database.
+        limit: The maximum number of temperature records to return.
+        cursor: The ID of the last temperature record of the previous page.
+
+    Returns:
+        A JSON response with the temperature records ordered by ID and its ETag,
+        or a 304 if the client copy is current.
+
+    """
+    temperatures = await service.gets(limit=limit, cursor=cursor, filters=filters)
+    return json_response_with_etag(request, TEMPERATURE_READ_LIST_ADAPTER.dump_json(temperatures))
+
+
+@router_collection.get("/stream", response_class=StreamingResponse)
+async def stream_temperatures(
+    service: Annotated[TemperatureService, Depends(get_temperature_service)],
+    cursor: Annotated[int | None, Query(ge=0)] = None,
+) -> StreamingResponse:
+    """Stream every temperature record as newline-delimited JSON.
+
+    Args:
+        service: The temperature service dependency.
+        cursor: Only stream temperature records with an ID greater than this value.
+
+    Returns:
+        A streaming response with one temperature record per line, ordered by ID.
+
+    """
+    return StreamingResponse(service.stream(cursor=cursor), media_type="application/x-ndjson")
@@ -10,7 +10,7 @@ from .constants import DeviceIdStr, TemperatureValue
 class TemperatureBase(SQLModel):
     """Base schema for temperature data with shared fields."""
 
-    device_id: DeviceIdStr = Field(index=True, description="Unique identifier for the device")
+    device_id: DeviceIdStr = Field(description="Unique identifier for the device")
     temperature: TemperatureValue = Field(description="Temperature value in Celsius")
     timestamp: datetime = Field(description="Timestamp when the temperature was recorded")
 
@@ -30,3 +30,14 @@ class TemperatureRead(TemperatureBase):
 
     id: int
     timestamp: datetime
+
+
+class TemperatureFilter(SQLModel):
+    """Schema for filtering temperature records (API query parameters).
+
+    All fields are optional; unset fields do not filter.
+    """
+
+    device_id: DeviceIdStr | None = Field(default=None, description="Only match records from this device")
+    since: datetime | None = Field(default=None, description="Only match records taken at or after this time")
+    until: datetime | None = Field(default=None, description="Only match records taken at or before this time")
@@ -1,13 +1,24 @@
 """Service layer for temperature operations."""
 
+from collections.abc import AsyncIterator
+
+from app.core.constants import DEFAULT_PAGE_SIZE, STREAM_BATCH_SIZE
 from loguru import logger
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select
 from sqlalchemy.exc import IntegrityError
+from sqlmodel import col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from .exceptions import TemperatureNotFoundError
 from .models import Temperature
-from .schemas import TemperatureCreate, TemperatureRead
+from .schemas import TemperatureCreate, TemperatureFilter, TemperatureRead
+
+TEMPERATURE_READ_ADAPTER = TypeAdapter(TemperatureRead)
+"""Cached validator used to serialize a single temperature row."""
+
+TEMPERATURE_READ_LIST_ADAPTER = TypeAdapter(list[TemperatureRead])
+"""Cached validator used to serialize a list of temperature rows in one pass."""
 
 
 class TemperatureService:
@@ -21,9 +32,9 @@ class TemperatureService:
 
         """
         self.session = session
-        logger.debug(f"TemperatureService initialized with async session: {session}")
+        logger.debug("TemperatureService initialized with async session: {}", session)
 
-    async def create(self, temperature_data: TemperatureCreate) -> Temperature:
+    async def create(self, temperature_data: TemperatureCreate) -> TemperatureRead:
         """Create a new temperature record.
 
         Args:
@@ -34,22 +45,48 @@ class TemperatureService:
 
         """
         try:
-            # Create Temperature instance from input data
-            temperature = Temperature.model_validate(temperature_data)
+            statement = insert(Temperature).values(**temperature_data.model_dump()).returning(Temperature)
+            result = await self.session.execute(statement)
+            temperature = TEMPERATURE_READ_ADAPTER.validate_python(result.scalar_one(), from_attributes=True)
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            logger.error("Failed to create temperature record: {}", e)
+            raise
+        else:
+            logger.info(
+                "Created temperature record: id={}, device={}, temp={}°C, timestamp={}",
+                temperature.id,
+                temperature.device_id,
+                temperature.temperature,
+                temperature.timestamp,
+            )
+            return temperature
+
+    async def create_many(self, temperatures_data: list[TemperatureCreate]) -> list[TemperatureRead]:
+        """Create several temperature records in a single statement and transaction.
+
+        Args:
+            temperatures_data: The temperature data for creation.
 
-            # If timestamp is provided in the data, use it; otherwise, default_factory will be used
-            if temperature_data.timestamp is not None:
-                temperature.timestamp = temperature_data.timestamp
+        Returns:
+            The created temperature records with their database IDs, in input order.
 
-            self.session.add(temperature)
+        """
+        if not temperatures_data:
+            return []
+        try:
+            statement = insert(Temperature).returning(Temperature, sort_by_parameter_order=True)
+            result = await self.session.execute(statement, [temperature_data.model_dump() for temperature_data in temperatures_data])
+            temperatures = TEMPERATURE_READ_LIST_ADAPTER.validate_python(result.scalars().all(), from_attributes=True)
             await self.session.commit()
-            await self.session.refresh(temperature)
-            logger.info(f"Created temperature record: id={temperature.id}, device={temperature.device_id}, temp={temperature.temperature}°C, timestamp={temperature.timestamp}")
-            return TemperatureRead.model_validate(temperature)
         except IntegrityError as e:
             await self.session.rollback()
-            logger.error(f"Failed to create temperature record: {e}")
+            logger.error("Failed to create temperature records: {}", e)
             raise
+        else:
+            logger.info("Created {} temperature records", len(temperatures))
+            return temperatures
 
     async def get(self, temperature_id: int) -> TemperatureRead:
         """Retrieve a temperature record by its ID.
@@ -64,27 +101,66 @@ class TemperatureService:
             TemperatureNotFoundError: If the temperature record is not found.
 
         """
-        query = select(Temperature).where(Temperature.id == temperature_id)
-        result = await self.session.execute(query)
-        temperature = result.scalar_one_or_none()
-        if not temperature:
-            logger.warning(f"Instrument with ID {temperature_id} not found")
+        temperature = await self.session.get(Temperature, temperature_id)
+        if temperature is None:
+            logger.warning("Temperature with ID {} not found", temperature_id)
             raise TemperatureNotFoundError(temperature_id)
-        logger.debug(f"Retrieved temperature with ID {temperature_id}")
-        return TemperatureRead.model_validate(temperature)
+        logger.debug("Retrieved temperature with ID {}", temperature_id)
+        return TEMPERATURE_READ_ADAPTER.validate_python(temperature, from_attributes=True)
+
+    async def gets(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: int | None = None,
+        filters: TemperatureFilter | None = None,
+    ) -> list[TemperatureRead]:
+        """Retrieve a page of temperature records, ordered by ID.
+
+        Filters are applied in the database so that the (device_id, timestamp) index can be used.
 
-    async def gets(self) -> list[TemperatureRead]:
-        """Retrieve temperature records with optional filters.
+        Args:
+            limit: The maximum number of temperature records to return.
+            cursor: Only return temperature records with an ID greater than this value.
+            filters: Only return temperature records matching these filters.
 
         Returns:
-            A list of temperature records matching the filters.
+            A list of temperature records.
 
         """
-        query = select(Temperature)
+        query = select(Temperature).order_by(col(Temperature.id)).limit(limit)
+        if cursor is not None:
+            query = query.where(col(Temperature.id) > cursor)
+        if filters is not None:
+            if filters.device_id is not None:
+                query = query.where(col(Temperature.device_id) == filters.device_id)
+            if filters.since is not None:
+                query = query.where(col(Temperature.timestamp) >= filters.since)
+            if filters.until is not None:
+                query = query.where(col(Temperature.timestamp) <= filters.until)
         result = await self.session.execute(query)
         temperatures = result.scalars().all()
-        logger.debug(f"Retrieved {len(temperatures)} temperatures")
-        return [TemperatureRead.model_validate(temperature) for temperature in temperatures]
+        logger.debug("Retrieved {} temperatures", len(temperatures))
+        return TEMPERATURE_READ_LIST_ADAPTER.validate_python(temperatures, from_attributes=True)
+
+    async def stream(self, cursor: int | None = None) -> AsyncIterator[bytes]:
+        """Stream all temperature records as newline-delimited JSON, ordered by ID.
+
+        Rows are fetched in batches of STREAM_BATCH_SIZE, so memory usage does not
+        grow with the size of the temperature table.
+
+        Args:
+            cursor: Only stream temperature records with an ID greater than this value.
+
+        Yields:
+            One JSON-encoded temperature record per line.
+
+        """
+        query = select(Temperature).order_by(col(Temperature.id)).execution_options(yield_per=STREAM_BATCH_SIZE)
+        if cursor is not None:
+            query = query.where(col(Temperature.id) > cursor)
+        result = await self.session.stream_scalars(query)
+        async for temperature in result:
+            yield TEMPERATURE_READ_ADAPTER.dump_json(TEMPERATURE_READ_ADAPTER.validate_python(temperature, from_attributes=True)) + b"\n"
 
     async def delete(self, temperature_id: int) -> None:
         """Delete a temperature record by its ID.
@@ -96,13 +172,11 @@ class TemperatureService:
             TemperatureNotFoundError: If the temperature record is not found.
 
         """
-        query = select(Temperature).where(Temperature.id == temperature_id)
-        result = await self.session.execute(query)
-        temperature = result.scalar_one_or_none()
-        if not temperature:
-            logger.warning(f"Temperature with ID {temperature_id} not found for deletion")
+        statement = delete(Temperature).where(col(Temperature.id) == temperature_id).returning(col(Temperature.id))
+        result = await self.session.execute(statement)
+        if result.first() is None:
+            logger.warning("Temperature with ID {} not found for deletion", temperature_id)
             raise TemperatureNotFoundError(temperature_id)
 
-        await self.session.delete(temperature)
         await self.session.commit()
-        logger.info(f"Deleted temperature with ID {temperature_id}")
+        logger.info("Deleted temperature with ID {}", temperature_id)
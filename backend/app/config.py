@@ -1,6 +1,7 @@
 """Application configuration settings."""
 
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic import Field, computed_field
@@ -40,6 +41,13 @@ class Settings(BaseSettings):
     mariadb_database: str = Field(default="elims", description="MariaDB database name")
     mariadb_root_password: str = Field(default="2Fj0nKzaRcT4EVBkDpLvifAyhUto5Cd1", description="MariaDB root password")
 
+    # Database connection pool Configuration
+    db_pool_size: int = Field(default=25, ge=1, description="Number of connections kept open in the database pool")
+    db_max_overflow: int = Field(default=25, ge=0, description="Extra connections allowed above the pool size under load")
+    db_pool_recycle: int = Field(default=3600, description="Seconds after which a pooled connection is recycled")
+    db_pool_timeout: float = Field(default=30.0, gt=0, description="Seconds to wait for a pooled connection before giving up")
+    db_pool_pre_ping: bool = Field(default=True, description="Check pooled connections are alive before using them")
+
     # Redis Configuration
     redis_host: str = Field(default="redis", description="Redis host")
     redis_port: int = Field(default=6379, description="Redis port")
@@ -72,9 +80,9 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def db_url(self) -> str:
-        """Construct the database URL from the settings."""
+        """Construct the database URL from the settings, once per settings instance."""
         match self.db_architecture:
             case DbArchitecture.SQLITE:
                 path = ":memory:" if str(self.sqlite_path) == ":memory:" else self.sqlite_path.as_posix()
@@ -83,5 +91,12 @@ class Settings(BaseSettings):
                 return f"mysql://{self.mariadb_user}:{self.mariadb_password}@{self.mariadb_host}:{self.mariadb_port}/{self.mariadb_database}"
 
 
-# Create a single instance of your settings
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load the application settings on first use and return the same instance afterwards.
+
+    Returns:
+        The application settings.
+
+    """
+    return Settings()
@@ -0,0 +1,10 @@
+"""Constants shared across the backend API modules."""
+
+DEFAULT_PAGE_SIZE = 100
+"""Default number of records returned by a collection endpoint."""
+
+MAX_PAGE_SIZE = 1000
+"""Upper bound on the number of records a collection endpoint may return."""
+
+STREAM_BATCH_SIZE = 1000
+"""Number of rows fetched from the database per round-trip when streaming a collection."""
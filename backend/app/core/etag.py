@@ -0,0 +1,57 @@
+"""Conditional GET support for JSON responses based on entity tags."""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "no-cache"
+"""Cache-Control value sent with tagged responses: clients may cache them but must revalidate."""
+
+
+def compute_etag(content: bytes) -> str:
+    """Compute a weak entity tag from a serialized response body.
+
+    Args:
+        content: The serialized response body.
+
+    Returns:
+        The weak entity tag, quoted as required by the ETag header.
+
+    """
+    return f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Check whether an entity tag matches an If-None-Match header, using weak comparison.
+
+    Args:
+        etag: The entity tag of the current representation.
+        if_none_match: The raw If-None-Match header value, if any.
+
+    Returns:
+        True if the client already holds the current representation.
+
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate == "*" or candidate.removeprefix("W/") == opaque_tag for candidate in (tag.strip() for tag in if_none_match.split(",")))
+
+
+def json_response_with_etag(request: Request, content: bytes) -> Response:
+    """Build a JSON response tagged with an ETag, or a 304 if the client copy is current.
+
+    Args:
+        request: The incoming request, checked for an If-None-Match header.
+        content: The serialized JSON response body.
+
+    Returns:
+        A 304 Not Modified response without body if the ETag matches, otherwise
+        a JSON response carrying the body.
+
+    """
+    etag = compute_etag(content)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(etag, request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
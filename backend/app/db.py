@@ -1,13 +1,16 @@
 """Database module for handling connections and session management."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 
-from app.config import settings
+from app.config import DbArchitecture, get_settings
 from loguru import logger
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+settings = get_settings()
 base_url = settings.db_url
 if base_url.startswith("sqlite:///"):
     async_url = base_url.replace("sqlite:///", "sqlite+aiosqlite:///")
@@ -16,7 +19,17 @@ elif base_url.startswith("mysql://"):
 else:
     async_url = base_url
 
-engine = create_async_engine(async_url, echo=settings.sql_echo, future=True)
+pool_options: dict[str, object] = {}
+if settings.db_architecture is DbArchitecture.MARIADB:
+    pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+engine = create_async_engine(async_url, echo=settings.sql_echo, future=True, **pool_options)
 SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -24,7 +37,20 @@ async def create_db_and_tables() -> None:
     """Initialize the database and create tables asynchronously."""
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
-    logger.info(f"Database tables created for URL: {base_url}")
+    logger.info("Database tables created for URL: {}", base_url)
+
+
+async def warm_up_pool() -> None:
+    """Open the pooled MariaDB connections up front so the first requests do not pay the connection latency."""
+    if settings.db_architecture is not DbArchitecture.MARIADB:
+        return
+
+    async def open_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(open_connection() for _ in range(settings.db_pool_size)))
+    logger.info("Database pool warmed up with {} connections", settings.db_pool_size)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession]:
@@ -1,44 +1,47 @@
 """ELIMS Backend - MQTT Publisher Module for sending configurations to devices."""
 
-import json
+from functools import lru_cache
 
-from app.config import settings
+import orjson
+from app.config import get_settings
 from elims_common.logger.logger import logger
-from elims_common.mqtt import MQTTConfig
+from elims_common.mqtt import MQTT_LWT_OFFLINE_PAYLOAD, MQTTConfig
 from elims_common.mqtt import MQTTPublisher as BaseMQTTPublisher
 
+from .utils import device_topic, pad_device_id
+
 CLIENT_TYPE = "publisher"
 CLIENT_ID = f"elims-backend-{CLIENT_TYPE}"
 
-# Build MQTT config for publisher with TLS/SSL
-MQTT_BACKEND_CONFIG = MQTTConfig(
-    broker_host=settings.mqtt_host,
-    broker_port=settings.mqtt_port,
-    username=settings.mqtt_username,
-    password=settings.mqtt_password,
-    client_id=CLIENT_ID,
-    client_type=CLIENT_TYPE,
-    lwt_topic=f"elims/{CLIENT_ID}/status",
-    lwt_payload=json.dumps({"status": "offline"}),
-    keepalive=60,
-    reconnect_on_failure=True,
-    certificate_authority_file=settings.mqtt_certificate_authority_file,
-    certificate_file=settings.mqtt_certificate_file,
-    key_file=settings.mqtt_key_file,
-)
 
+@lru_cache(maxsize=1)
+def get_mqtt_config() -> MQTTConfig:
+    """Build the MQTT configuration of the backend publisher, with TLS/SSL, on first use.
 
-class MQTTPublisher(BaseMQTTPublisher):
-    """Custom MQTT Publisher for ELIMS device configuration."""
+    Returns:
+        The MQTT configuration.
 
-    def __init__(self, config: MQTTConfig) -> None:
-        """Initialize publisher with environment defaults.
+    """
+    settings = get_settings()
+    return MQTTConfig(
+        broker_host=settings.mqtt_host,
+        broker_port=settings.mqtt_port,
+        username=settings.mqtt_username,
+        password=settings.mqtt_password,
+        client_id=CLIENT_ID,
+        client_type=CLIENT_TYPE,
+        lwt_topic=f"elims/{CLIENT_ID}/status",
+        lwt_payload=MQTT_LWT_OFFLINE_PAYLOAD,
+        keepalive=60,
+        reconnect_on_failure=True,
+        certificate_authority_file=settings.mqtt_certificate_authority_file,
+        certificate_file=settings.mqtt_certificate_file,
+        key_file=settings.mqtt_key_file,
+    )
 
-        Args:
-            config: The MQTT configuration.
 
-        """
-        super().__init__(config)
+class MQTTPublisher(BaseMQTTPublisher):
+    """Custom MQTT Publisher for ELIMS device configuration."""
 
     def publish_device_config(self, device_id: str, config_data: dict) -> bool:
         """Publish configuration to a specific device.
@@ -51,13 +54,19 @@ class MQTTPublisher(BaseMQTTPublisher):
             True if published successfully, False otherwise.
 
         """
-        topic = f"devices/{device_id}/config"
-        payload = json.dumps(config_data)
+        topic = device_topic(device_id, "config")
+        payload = orjson.dumps(config_data)
         try:
             result = self.publish(topic, payload)
-            logger.info(f"[CONFIG PUBLISH] | DEVICE: {device_id:<12} | TOPIC: {topic} | STATUS: {'OK' if result else 'FAILED'}")
+            logger.info(
+                "[CONFIG PUBLISH] | DEVICE: {} | TOPIC: {topic} | STATUS: {status}",
+                pad_device_id(device_id),
+                device=device_id,
+                topic=topic,
+                status="OK" if result else "FAILED",
+            )
         except (OSError, RuntimeError) as e:
-            logger.error(f"Failed to publish config to {device_id}: {e}")
+            logger.error("Failed to publish config to {}: {}", device_id, e)
             return False
         else:
             return result
@@ -74,13 +83,13 @@ class MQTTPublisher(BaseMQTTPublisher):
             True if published successfully, False otherwise.
 
         """
-        topic = f"devices/{device_id}/firmware"
-        payload = json.dumps({"url": firmware_url, "checksum": checksum, "enabled": True})
+        topic = device_topic(device_id, "firmware")
+        payload = orjson.dumps({"url": firmware_url, "checksum": checksum, "enabled": True})
         try:
             result = self.publish(topic, payload)
-            logger.info(f"[FIRMWARE UPDATE] | DEVICE: {device_id:<12} | URL: {firmware_url}")
+            logger.info("[FIRMWARE UPDATE] | DEVICE: {} | URL: {url}", pad_device_id(device_id), device=device_id, url=firmware_url)
         except (OSError, RuntimeError) as e:
-            logger.error(f"Failed to publish firmware update to {device_id}: {e}")
+            logger.error("Failed to publish firmware update to {}: {}", device_id, e)
             return False
         else:
             return result
@@ -97,13 +106,13 @@ class MQTTPublisher(BaseMQTTPublisher):
             True if published successfully, False otherwise.
 
         """
-        topic = f"devices/{device_id}/command"
-        payload = json.dumps({"command": command, "parameters": parameters or {}})
+        topic = device_topic(device_id, "command")
+        payload = orjson.dumps({"command": command, "parameters": parameters or {}})
         try:
             result = self.publish(topic, payload)
-            logger.info(f"[COMMAND PUBLISH] | DEVICE: {device_id:<12} | COMMAND: {command}")
+            logger.info("[COMMAND PUBLISH] | DEVICE: {} | COMMAND: {command}", pad_device_id(device_id), device=device_id, command=command)
         except (OSError, RuntimeError) as e:
-            logger.error(f"Failed to publish command to {device_id}: {e}")
+            logger.error("Failed to publish command to {}: {}", device_id, e)
             return False
         else:
             return result
@@ -123,12 +132,13 @@ def get_publisher() -> MQTTPublisher:
     max_attempts = 3
     while attempt < max_attempts:
         try:
-            publisher = MQTTPublisher(MQTT_BACKEND_CONFIG)
+            mqtt_config = get_mqtt_config()
+            publisher = MQTTPublisher(mqtt_config)
             publisher.connect()
-            logger.info(f"[MQTT PUBLISHER] Connected: {MQTT_BACKEND_CONFIG.broker_host}:{MQTT_BACKEND_CONFIG.broker_port}")
+            logger.info("[MQTT PUBLISHER] Connected: {}:{}", mqtt_config.broker_host, mqtt_config.broker_port)
         except (OSError, RuntimeError) as e:
             attempt += 1
-            logger.error(f"Publisher connection attempt {attempt}/{max_attempts} failed: {e}")
+            logger.error("Publisher connection attempt {}/{} failed: {}", attempt, max_attempts, e)
             if attempt >= max_attempts:
                 logger.error("Publisher: Failed to connect after maximum attempts")
                 raise
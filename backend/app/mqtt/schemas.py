@@ -0,0 +1,22 @@
+"""Schemas for the MQTT messages received by the backend."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+class TelemetryMessage(BaseModel):
+    """Schema for a raspberry telemetry payload.
+
+    Readings other than the temperature (e.g. humidity) are kept as extra fields.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    sensor_id: str | None = Field(default=None, description="Identifier of the sensor on the device")
+    temperature: float | None = Field(default=None, description="Temperature value in Celsius")
+    timestamp: datetime | None = Field(default=None, description="Unix timestamp in seconds or ISO 8601 string")
+
+
+TELEMETRY_MESSAGE_ADAPTER = TypeAdapter(TelemetryMessage)
+"""Cached validator decoding a raw telemetry payload straight into a TelemetryMessage."""
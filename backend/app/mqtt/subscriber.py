@@ -1,49 +1,95 @@
 """ELIMS Backend - MQTT Subscriber Module."""
 
-import json
 from collections.abc import Callable
 from datetime import UTC, datetime
+from functools import lru_cache
 from queue import Empty as QueueEmpty
 from queue import Queue
 from threading import Event, Thread
+from time import monotonic
+from typing import Any, TypeVar
 
+import orjson
 from app.api.temperature.models import Temperature
-from app.config import settings
+from app.config import DbArchitecture, get_settings
 from elims_common.logger.logger import logger
-from elims_common.mqtt import MQTTConfig
+from elims_common.mqtt import MQTT_LWT_OFFLINE_PAYLOAD, MQTTConfig
 from elims_common.mqtt import MQTTSubscriber as BaseMQTTSubscriber
-from pydantic import SecretStr
-from sqlalchemy import create_engine
+from pydantic import SecretStr, ValidationError
+from sqlalchemy import Engine, create_engine, insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session
 
+from .schemas import TELEMETRY_MESSAGE_ADAPTER, TelemetryMessage
+from .utils import pad_device_id
+
+MessageT = TypeVar("MessageT")
+
+BATCH_MAX_SIZE = 200
+"""Maximum number of temperature readings written to the database in one transaction."""
+
+BATCH_MAX_DELAY = 0.1
+"""Maximum time in seconds a temperature reading waits in the worker for its batch to fill."""
+
 CLIENT_TYPE = "subscriber"
 CLIENT_ID = f"elims-backend-{CLIENT_TYPE}"
-MQTT_BACKEND_CONFIG = MQTTConfig(
-    broker_host=settings.mqtt_host,
-    broker_port=settings.mqtt_port,
-    client_id=CLIENT_ID,
-    client_type=CLIENT_TYPE,
-    username=settings.mqtt_username,
-    password=SecretStr(settings.mqtt_password),
-    lwt_topic=f"elims/{CLIENT_ID}/status",
-    lwt_payload=json.dumps({"status": "offline"}),
-    keepalive=60,
-    reconnect_on_failure=True,
-    certificate_authority_file=settings.mqtt_certificate_authority_file,
-    certificate_file=settings.mqtt_certificate_file,
-    key_file=settings.mqtt_key_file,
-    tls_insecure=settings.mqtt_tls_insecure,
-)
-
-# Create synchronous engine for subscriber thread (avoids async/await issues)
-sync_db_url = settings.db_url
-if sync_db_url.startswith("mysql+aiomysql://"):
-    sync_db_url = sync_db_url.replace("mysql+aiomysql://", "mysql+pymysql://")
-elif sync_db_url.startswith("mysql://"):
-    sync_db_url = sync_db_url.replace("mysql://", "mysql+pymysql://")
-
-sync_engine = create_engine(sync_db_url, echo=settings.sql_echo)
+
+
+@lru_cache(maxsize=1)
+def get_mqtt_config() -> MQTTConfig:
+    """Build the MQTT configuration of the backend subscriber on first use.
+
+    Returns:
+        The MQTT configuration.
+
+    """
+    settings = get_settings()
+    return MQTTConfig(
+        broker_host=settings.mqtt_host,
+        broker_port=settings.mqtt_port,
+        client_id=CLIENT_ID,
+        client_type=CLIENT_TYPE,
+        username=settings.mqtt_username,
+        password=SecretStr(settings.mqtt_password),
+        lwt_topic=f"elims/{CLIENT_ID}/status",
+        lwt_payload=MQTT_LWT_OFFLINE_PAYLOAD,
+        keepalive=60,
+        reconnect_on_failure=True,
+        certificate_authority_file=settings.mqtt_certificate_authority_file,
+        certificate_file=settings.mqtt_certificate_file,
+        key_file=settings.mqtt_key_file,
+        tls_insecure=settings.mqtt_tls_insecure,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sync_engine() -> Engine:
+    """Create the synchronous engine of the subscriber thread on first use (avoids async/await issues).
+
+    The engine holds a single connection, shared by every batch of the worker thread.
+
+    Returns:
+        The synchronous database engine.
+
+    """
+    settings = get_settings()
+    sync_db_url = settings.db_url
+    if sync_db_url.startswith("mysql+aiomysql://"):
+        sync_db_url = sync_db_url.replace("mysql+aiomysql://", "mysql+pymysql://")
+    elif sync_db_url.startswith("mysql://"):
+        sync_db_url = sync_db_url.replace("mysql://", "mysql+pymysql://")
+
+    # The worker thread holds on to its connection between messages, so keep it alive across idle periods
+    sync_pool_options: dict[str, object] = {}
+    if settings.db_architecture is DbArchitecture.MARIADB:
+        sync_pool_options = {
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+        }
+
+    # The worker thread is the only writer: a single static connection skips the pool checkout bookkeeping
+    return create_engine(sync_db_url, echo=settings.sql_echo, poolclass=StaticPool, **sync_pool_options)
 
 
 class MQTTSubscriber(BaseMQTTSubscriber):
@@ -54,54 +100,94 @@ class MQTTSubscriber(BaseMQTTSubscriber):
         super().__init__(config)
         self.queue: Queue[dict] = Queue()
 
-    def subscribe_raspberry_telemetry(self, callback: Callable[[str, dict[str, object]], None]) -> None:
-        """Subscribe to raspberry telemetry topics with JSON parsing."""
+    def _subscribe_decoded(self, topic_filter: str, decode: Callable[[str], MessageT], callback: Callable[[str, MessageT], None]) -> None:
+        """Subscribe to a topic filter, decoding each payload before it is passed to the callback.
+
+        Args:
+            topic_filter: MQTT topic filter to subscribe to (wildcards allowed).
+            decode: Payload decoder, raising ValueError on invalid JSON and ValidationError on
+                payloads that do not match the expected schema.
+            callback: Callback called with the topic and the decoded message.
+
+        """
 
         def wrapper(topic: str, payload: str) -> None:
             try:
-                data = json.loads(payload)
-                callback(topic, data)
-            except json.JSONDecodeError:
+                message = decode(payload)
+            except ValidationError as e:
+                if e.errors()[0]["type"] == "json_invalid":
+                    logger.error(self.msg.invalid_json_payload(topic, payload))
+                else:
+                    logger.error(self.msg.invalid_payload_schema(topic, payload))
+            except ValueError:
                 logger.error(self.msg.invalid_json_payload(topic, payload))
+            else:
+                callback(topic, message)
+
+        self.subscribe(topic_filter, wrapper)
 
-        self.subscribe("devices/+/telemetry", wrapper)
+    def subscribe_raspberry_telemetry(self, callback: Callable[[str, TelemetryMessage], None]) -> None:
+        """Subscribe to raspberry telemetry topics, decoding payloads directly into TelemetryMessage."""
+        self._subscribe_decoded("devices/+/telemetry", TELEMETRY_MESSAGE_ADAPTER.validate_json, callback)
 
     def subscribe_raspberry_system(self, callback: Callable[[str, dict[str, object]], None]) -> None:
         """Subscribe to raspberry system status updates with JSON parsing."""
+        self._subscribe_decoded("devices/+/system", orjson.loads, callback)
 
-        def wrapper(topic: str, payload: str) -> None:
-            try:
-                data = json.loads(payload)
-                callback(topic, data)
-            except json.JSONDecodeError:
-                logger.error(self.msg.invalid_json_payload(topic, payload))
 
-        self.subscribe("devices/+/system", wrapper)
+def _device_id_from_topic(topic: str) -> str:
+    """Extract the device ID from a "devices/{device_id}/..." topic without splitting it into a list.
+
+    Args:
+        topic: The MQTT topic the message was received on.
+
+    Returns:
+        The device ID segment of the topic.
+
+    """
+    return topic.partition("/")[2].partition("/")[0]
 
 
 def _sync_worker(queue: Queue, stop_event: Event) -> None:
     """Worker thread that processes temperature data using synchronous database operations.
 
+    Readings are drained from the queue in batches of up to BATCH_MAX_SIZE, waiting at most
+    BATCH_MAX_DELAY seconds after the first one, and each batch is saved in a single transaction.
+    The worker holds one session for its whole lifetime.
+
     Args:
         queue: Queue to read temperature data from.
         stop_event: Event to signal when to stop.
 
     """
-    while not stop_event.is_set():
-        try:
-            # Non-blocking queue get with timeout
-            item = queue.get(timeout=1)
+    stopping = False
+    with Session(get_sync_engine()) as session:
+        while not stopping and not stop_event.is_set():
+            try:
+                # Block until the first reading of the batch arrives
+                item = queue.get(timeout=1)
+            except QueueEmpty:
+                # Queue timeout - continue processing
+                continue
             if item is None:  # Sentinel value to stop
                 break
 
-            device_id = item["device_id"]
-            temperature = item["temperature"]
-            timestamp = item["timestamp"]
+            batch = [item]
+            deadline = monotonic() + BATCH_MAX_DELAY
+            while len(batch) < BATCH_MAX_SIZE:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = queue.get(timeout=remaining)
+                except QueueEmpty:
+                    break
+                if item is None:  # Sentinel value to stop, once this batch is saved
+                    stopping = True
+                    break
+                batch.append(item)
 
-            save_temperature_sync(device_id, temperature, timestamp)
-        except QueueEmpty:
-            # Queue timeout - continue processing
-            continue
+            save_temperatures_sync(session, batch)
 
 
 def run_subscriber(stop_event: Event | None = None) -> None:
@@ -114,49 +200,41 @@ def run_subscriber(stop_event: Event | None = None) -> None:
     if stop_event is None:
         stop_event = Event()
 
-    subscriber = MQTTSubscriber(MQTT_BACKEND_CONFIG)
+    subscriber = MQTTSubscriber(get_mqtt_config())
 
     # Start sync worker thread for database operations
     worker_thread = Thread(target=_sync_worker, args=(subscriber.queue, stop_event), daemon=True)
     worker_thread.start()
 
-    def handle_raspberry_telemetry(topic: str, data: dict[str, object]) -> None:
+    def handle_raspberry_telemetry(topic: str, message: TelemetryMessage) -> None:
         """Handle incoming telemetry updates and queue for database save."""
-        device_id = topic.split("/")[1]
-        data_str = json.dumps(data)
-        logger.info(f"[TELEMETRY UPDATE] | DEVICE: {device_id:<12} | DATA: {data_str}")
-
-        # Extract temperature and timestamp from payload
-        temperature_value = data.get("temperature")
-        timestamp_value = data.get("timestamp")
-        if temperature_value is not None and timestamp_value is not None:
-            try:
-                temp = float(temperature_value)
-                # Handle both Unix timestamp (float) and ISO 8601 string formats
-                if isinstance(timestamp_value, str):
-                    dt = datetime.fromisoformat(timestamp_value.replace("Z", "+00:00"))
-                    timestamp = dt.timestamp()
-                else:
-                    timestamp = float(timestamp_value)
-
-                # Queue the temperature for processing by the sync worker
-                subscriber.queue.put(
-                    {
-                        "device_id": device_id,
-                        "temperature": temp,
-                        "timestamp": timestamp,
-                    }
-                )
-            except (ValueError, TypeError) as e:
-                logger.error(f"Invalid telemetry values: temperature={temperature_value}, timestamp={timestamp_value}, error: {e}")
+        device_id = _device_id_from_topic(topic)
+        # Per-message details are debug output, the sync worker reports at info level once per saved batch.
+        # Serialize the payload only if a sink actually emits the record; keyword fields are also bound as record extras
+        logger.opt(lazy=True).debug(
+            "[TELEMETRY UPDATE] | DEVICE: {} | DATA: {data}",
+            lambda: pad_device_id(device_id),
+            device=lambda: device_id,
+            data=lambda: message.model_dump_json(exclude_none=True),
+        )
+
+        if message.temperature is not None and message.timestamp is not None:
+            # Queue the temperature for processing by the sync worker
+            subscriber.queue.put(
+                {
+                    "device_id": device_id,
+                    "temperature": message.temperature,
+                    "timestamp": message.timestamp.astimezone(UTC),
+                }
+            )
         else:
             logger.warning("Telemetry payload missing temperature or timestamp")
 
     def handle_raspberry_status(topic: str, data: dict[str, object]) -> None:
         """Handle incoming system status updates and log them."""
-        device_id = topic.split("/")[1]
+        device_id = _device_id_from_topic(topic)
         status = str(data.get("status", "unknown")).upper()
-        logger.info(f"[SYSTEM STATUS] | DEVICE: {device_id:<12} | STATUS: {status}")
+        logger.info("[SYSTEM STATUS] | DEVICE: {} | STATUS: {status}", pad_device_id(device_id), device=device_id, status=status)
 
     subscriber.subscribe_raspberry_telemetry(handle_raspberry_telemetry)
     subscriber.subscribe_raspberry_system(handle_raspberry_status)
@@ -164,13 +242,10 @@ def run_subscriber(stop_event: Event | None = None) -> None:
     subscriber.connect()
 
     try:
-        import time
-
-        while True:
-            if stop_event.is_set():
-                logger.info("Subscriber stop event received.")
-                break
-            time.sleep(1)
+        # Park the thread until the stop event is set; the timeout only keeps it responsive to KeyboardInterrupt
+        while not stop_event.wait(timeout=60):
+            continue
+        logger.info("Subscriber stop event received.")
     except KeyboardInterrupt:
         logger.warning("Subscriber manually stopped.")
     finally:
@@ -193,31 +268,54 @@ def start_subscriber_thread() -> tuple[Thread, Event]:
     return thread, stop_event
 
 
-def save_temperature_sync(device_id: str, temperature: float, timestamp: float) -> None:
+def save_temperatures_sync(session: Session, items: list[dict[str, Any]]) -> None:
+    """Save a batch of temperature data to the database in a single transaction.
+
+    If the batch cannot be inserted, each reading is retried on its own so that one invalid
+    reading does not cause the others to be lost.
+
+    Args:
+        session: The synchronous database session of the worker.
+        items: Queued readings with device_id, temperature and UTC timestamp keys.
+
+    """
+    try:
+        session.execute(insert(Temperature), items)
+        session.commit()
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error("Failed to save batch of {} temperatures, retrying one by one: {}", len(items), e)
+    else:
+        logger.info("Temperatures saved: {} readings", len(items))
+        return
+
+    for item in items:
+        save_temperature_sync(session, item["device_id"], item["temperature"], item["timestamp"])
+
+
+def save_temperature_sync(session: Session, device_id: str, temperature: float, timestamp: datetime) -> None:
     """Save temperature data to the database using synchronous operations.
 
     Args:
+        session: The synchronous database session of the worker.
         device_id: The unique identifier of the device.
         temperature: The temperature value in Celsius.
-        timestamp: Unix timestamp from sensor (seconds).
+        timestamp: UTC timestamp from sensor.
 
     """
-    with Session(sync_engine) as session:
-        try:
-            # Parse unix timestamp
-            parsed_timestamp = datetime.fromtimestamp(timestamp, tz=UTC)
-
-            # Create temperature record directly
-            temp_record = Temperature(device_id=device_id, temperature=temperature, timestamp=parsed_timestamp)
-            session.add(temp_record)
-            session.commit()
-
-            logger.info(f"Temperature saved: device={device_id}, temp={temperature}°C, timestamp={parsed_timestamp}")
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Failed to save temperature: {e}")
-        except ValueError as e:
-            logger.error(f"Invalid temperature or timestamp data: device={device_id}, error={e}")
+    try:
+        # Create temperature record directly
+        temp_record = Temperature(device_id=device_id, temperature=temperature, timestamp=timestamp)
+        session.add(temp_record)
+        session.commit()
+
+        logger.info("Temperature saved: device={}, temp={}°C, timestamp={}", device_id, temperature, timestamp)
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error("Failed to save temperature: {}", e)
+    except ValueError as e:
+        session.rollback()
+        logger.error("Invalid temperature or timestamp data: device={}, error={}", device_id, e)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,37 @@
+"""ELIMS Backend - MQTT Utilities shared by the publisher and subscriber."""
+
+from functools import lru_cache
+
+DEVICE_ID_LOG_WIDTH = 12
+"""Column width of the device ID in MQTT log lines."""
+
+
+@lru_cache(maxsize=256)
+def pad_device_id(device_id: str) -> str:
+    """Left-align a device ID to the log column width.
+
+    The set of devices is small, so each device ID is padded only once.
+
+    Args:
+        device_id: The unique identifier of the device.
+
+    Returns:
+        The device ID padded with spaces to DEVICE_ID_LOG_WIDTH characters.
+
+    """
+    return device_id.ljust(DEVICE_ID_LOG_WIDTH)
+
+
+@lru_cache(maxsize=1024)
+def device_topic(device_id: str, kind: str) -> str:
+    """Build the topic of a device channel, once per device and channel.
+
+    Args:
+        device_id: The unique identifier of the device.
+        kind: The channel of the device (e.g. "config", "firmware", "command").
+
+    Returns:
+        The "devices/{device_id}/{kind}" topic.
+
+    """
+    return f"devices/{device_id}/{kind}"
@@ -10,9 +10,15 @@ from fastapi import APIRouter
 
 router = APIRouter()
 
-router.include_router(router_collection_instruments)
-router.include_router(router_resource_instruments)
-router.include_router(router_collection_locations)
-router.include_router(router_resource_locations)
-router.include_router(router_collection_temperature)
-router.include_router(router_resource_temperature)
+MODULE_ROUTERS: tuple[APIRouter, ...] = (
+    router_collection_instruments,
+    router_resource_instruments,
+    router_collection_locations,
+    router_resource_locations,
+    router_collection_temperature,
+    router_resource_temperature,
+)
+"""Collection and resource routers of every API module, in inclusion order."""
+
+for module_router in MODULE_ROUTERS:
+    router.include_router(module_router)
@@ -1,14 +1,16 @@
 """ELIMS - Electronic Laboratory Instrument Management System - Backend API."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from app.config import settings
-from app.db import create_db_and_tables
+from app.config import AppEnvironment, get_settings
+from app.db import create_db_and_tables, engine, warm_up_pool
 from app.mqtt.subscriber import start_subscriber_thread
 from app.routers import router
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 
 @asynccontextmanager
@@ -16,11 +18,15 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
     """Application lifespan manager."""
     # Startup: Create database tables
     await create_db_and_tables()
+    # The subscriber connects to the broker in its own thread, overlapping with the pool warm-up.
+    # It is only started once the tables exist, since its worker may save readings right away.
     subscriber_thread, subscriber_stop_event = start_subscriber_thread()
+    await warm_up_pool()
     yield
     # Shutdown: Cleanup resources
     subscriber_stop_event.set()
-    subscriber_thread.join(timeout=5)
+    # Join off the event loop, so in-flight requests keep being served while the subscriber drains
+    await asyncio.to_thread(subscriber_thread.join, timeout=5)
 
 
 app = FastAPI(
@@ -28,6 +34,7 @@ app = FastAPI(
     version="0.0.1",
     description="ELIMS - Electronic Laboratory Instrument Management System - Backend API.",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -52,4 +59,12 @@ async def health_check() -> dict[str, str]:
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint."""
-    return {"message": "ELIMS API", "version": "0.0.1", "environment": settings.environment.value}
+    return {"message": "ELIMS API", "version": "0.0.1", "environment": get_settings().environment.value}
+
+
+if get_settings().environment is not AppEnvironment.PRODUCTION:
+
+    @app.get("/debug/pool")
+    async def debug_pool() -> dict[str, str]:
+        """Database connection pool status endpoint (not exposed in production)."""
+        return {"status": engine.pool.status()}
@@ -1,7 +1,14 @@
 """Tests constants for the API instruments module."""
 
 import pytest
-from app.api.instruments.constants import InstrumentBrand, InstrumentType
+from app.api.instruments.constants import (
+    INSTRUMENT_BRAND_CHOICES,
+    INSTRUMENT_BRAND_LOOKUP,
+    INSTRUMENT_TYPE_CHOICES,
+    INSTRUMENT_TYPE_LOOKUP,
+    InstrumentBrand,
+    InstrumentType,
+)
 
 
 class TestInstrumentBrand:
@@ -34,6 +41,16 @@ class TestInstrumentBrand:
         expected_choices = ["Anritsu", "Keysight", "Teledyne LeCroy", "Tektronix"]
         assert InstrumentBrand.choices() == expected_choices
 
+    @pytest.mark.parametrize("instrument_brand", list(InstrumentBrand))
+    def test_instrument_brand_lookup(self, instrument_brand: InstrumentBrand) -> None:
+        """Test the value lookup table of InstrumentBrand enum members."""
+        assert INSTRUMENT_BRAND_LOOKUP[instrument_brand.value] is instrument_brand
+
+    def test_instrument_brand_choices_string(self) -> None:
+        """Test the precomputed display names of InstrumentBrand enum members."""
+        expected_choices = "Anritsu, Keysight, Teledyne LeCroy, Tektronix"
+        assert expected_choices == INSTRUMENT_BRAND_CHOICES
+
 
 class TestInstrumentType:
     """Tests for the InstrumentType enum."""
@@ -81,3 +98,12 @@ class TestInstrumentType:
             "Vector Network Analyzer",
         ]
         assert InstrumentType.choices() == expected_choices
+
+    @pytest.mark.parametrize("instrument_type", list(InstrumentType))
+    def test_instrument_type_lookup(self, instrument_type: InstrumentType) -> None:
+        """Test the value lookup table of InstrumentType enum members."""
+        assert INSTRUMENT_TYPE_LOOKUP[instrument_type.value] is instrument_type
+
+    def test_instrument_type_choices_string(self) -> None:
+        """Test the precomputed display names of InstrumentType enum members."""
+        assert ", ".join(InstrumentType.choices()) == INSTRUMENT_TYPE_CHOICES
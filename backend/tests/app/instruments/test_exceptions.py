@@ -37,6 +37,7 @@ class TestInstrumentExceptions:
         with pytest.raises(InstrumentNotFoundError) as exc_info:
             raise InstrumentNotFoundError(instrument_id)
         assert str(exc_info.value) == f"Instrument with ID {instrument_id} not found."
+        assert exc_info.value.detail == str(exc_info.value)
 
     def test_instrument_already_exist_error(self) -> None:
         """Test that InstrumentAlreadyExistError is raised with the correct message."""
@@ -44,3 +45,4 @@ class TestInstrumentExceptions:
         with pytest.raises(InstrumentAlreadyExistError) as exc_info:
             raise InstrumentAlreadyExistError(serial_number)
         assert str(exc_info.value) == f"Instrument with serial number '{serial_number}' already exists."
+        assert exc_info.value.detail == str(exc_info.value)
@@ -14,6 +14,14 @@ class TestInstrumentModel:
         assert models is not None
         assert hasattr(models, "Instrument")
 
+    def test_instrument_serial_number_is_unique(self) -> None:
+        """Test that the serial number column has a unique constraint and no separate index."""
+        column = models.Instrument.__table__.columns["serial_number"]
+
+        assert column.unique
+        assert not column.index
+        assert not any(column in index.columns.values() for index in models.Instrument.__table__.indexes)
+
     @pytest.mark.parametrize(
         "instrument",
         [
@@ -3,7 +3,8 @@
 This file contains tests for instrument API routes.
 """
 
-from unittest.mock import AsyncMock
+import json
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from app.api.instruments import routes
@@ -18,7 +19,8 @@ from app.api.instruments.schemas import (
     InstrumentUpdate,
 )
 from app.api.instruments.services import InstrumentService
-from fastapi import HTTPException, status
+from app.core.etag import compute_etag
+from fastapi import HTTPException, Request, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Constants for testing
@@ -37,6 +39,14 @@ def mock_service() -> AsyncMock:
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_request() -> MagicMock:
+    """Create a mock request without conditional headers."""
+    request = MagicMock(spec=Request)
+    request.headers = {}
+    return request
+
+
 @pytest.fixture
 def sample_instrument_read() -> InstrumentRead:
     """Create a sample instrument read schema with ID."""
@@ -68,6 +78,16 @@ class TestInstrumentRoutesExist:
         assert isinstance(service, InstrumentService)
         assert service.session is mock_session
 
+    def test_resource_routes_document_error_responses(self) -> None:
+        """Test that the 404 and 409 responses are declared on the resource routes."""
+        responses = {(method, route.path): route.responses for route in routes.router_resource.routes for method in route.methods}
+
+        assert status.HTTP_409_CONFLICT in responses["POST", "/instrument/"]
+        assert status.HTTP_404_NOT_FOUND in responses["GET", "/instrument/{instrument_id}"]
+        assert status.HTTP_404_NOT_FOUND in responses["PATCH", "/instrument/{instrument_id}"]
+        assert status.HTTP_409_CONFLICT in responses["PATCH", "/instrument/{instrument_id}"]
+        assert status.HTTP_404_NOT_FOUND in responses["DELETE", "/instrument/{instrument_id}"]
+
 
 class TestCreateInstrumentRoutes:
     """Tests for create instrument endpoints."""
@@ -107,33 +127,82 @@ class TestCreateInstrumentRoutes:
 
         assert exc_info.value.status_code == status.HTTP_409_CONFLICT
 
+    @pytest.mark.asyncio
+    async def test_create_instruments_success(self, mock_service: AsyncMock, sample_instrument_read: InstrumentRead) -> None:
+        """Test successful creation of several instruments at once."""
+        instrument_data = InstrumentCreate(
+            brand=InstrumentBrand.ANRITSU,
+            type=InstrumentType.SPECTRUM_ANALYZER,
+            model="MS2023A",
+            serial_number="SN123456",
+        )
+
+        mock_service.create_many.return_value = [sample_instrument_read]
+
+        result = await routes.create_instruments([instrument_data], mock_service)
+
+        assert result == [sample_instrument_read]
+        mock_service.create_many.assert_called_once_with([instrument_data])
+
+    @pytest.mark.asyncio
+    async def test_create_instruments_conflict(self, mock_service: AsyncMock) -> None:
+        """Test batch creation fails on duplicate serial number."""
+        instrument_data = InstrumentCreate(
+            brand=InstrumentBrand.ANRITSU,
+            type=InstrumentType.SPECTRUM_ANALYZER,
+            model="MS2023A",
+            serial_number="SN123456",
+        )
+
+        mock_service.create_many.side_effect = InstrumentAlreadyExistError("SN123456")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await routes.create_instruments([instrument_data], mock_service)
+
+        assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+        assert "SN123456" in exc_info.value.detail
+
 
 class TestGetInstrumentRoutes:
     """Tests for get instrument endpoints."""
 
     @pytest.mark.asyncio
-    async def test_get_instrument_success(self, mock_service: AsyncMock, sample_instrument_read: InstrumentRead) -> None:
+    async def test_get_instrument_success(self, mock_service: AsyncMock, mock_request: MagicMock, sample_instrument_read: InstrumentRead) -> None:
         """Test successful retrieval of a single instrument."""
         mock_service.get.return_value = sample_instrument_read
 
-        result = await routes.get_instrument(1, mock_service)
+        result = await routes.get_instrument(1, mock_service, mock_request)
 
-        assert result is not None
-        assert result.id == sample_instrument_read.id
+        assert result.status_code == status.HTTP_200_OK
+        assert json.loads(result.body)["id"] == sample_instrument_read.id
+        assert result.headers["etag"] == compute_etag(result.body)
         mock_service.get.assert_called_once_with(1)
 
     @pytest.mark.asyncio
-    async def test_get_instrument_not_found(self, mock_service: AsyncMock) -> None:
+    async def test_get_instrument_not_modified(self, mock_service: AsyncMock, mock_request: MagicMock, sample_instrument_read: InstrumentRead) -> None:
+        """Test retrieval returns 304 when the client already holds the current instrument."""
+        mock_service.get.return_value = sample_instrument_read
+        etag = (await routes.get_instrument(1, mock_service, mock_request)).headers["etag"]
+        mock_request.headers = {"if-none-match": etag}
+
+        result = await routes.get_instrument(1, mock_service, mock_request)
+
+        assert result.status_code == status.HTTP_304_NOT_MODIFIED
+        assert result.body == b""
+        assert result.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_get_instrument_not_found(self, mock_service: AsyncMock, mock_request: MagicMock) -> None:
         """Test retrieval fails when instrument not found."""
         mock_service.get.side_effect = InstrumentNotFoundError(999)
 
         with pytest.raises(HTTPException) as exc_info:
-            await routes.get_instrument(999, mock_service)
+            await routes.get_instrument(999, mock_service, mock_request)
 
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.asyncio
-    async def test_gets_instruments_success(self, mock_service: AsyncMock) -> None:
+    async def test_gets_instruments_success(self, mock_service: AsyncMock, mock_request: MagicMock) -> None:
         """Test successful listing of all instruments."""
         all_instruments = [
             InstrumentRead(
@@ -148,11 +217,12 @@ class TestGetInstrumentRoutes:
 
         mock_service.gets.return_value = all_instruments
 
-        result = await routes.gets_instruments(mock_service)
+        result = await routes.gets_instruments(mock_service, mock_request, limit=10, cursor=5)
 
-        assert len(result) == EXPECTED_INSTRUMENTS_COUNT
-        assert all(isinstance(item, InstrumentRead) for item in result)
-        mock_service.gets.assert_called_once()
+        assert result.media_type == "application/json"
+        assert json.loads(result.body) == [instrument.model_dump(mode="json") for instrument in all_instruments]
+        assert len(json.loads(result.body)) == EXPECTED_INSTRUMENTS_COUNT
+        mock_service.gets.assert_called_once_with(limit=10, cursor=5)
 
 
 class TestUpdateInstrumentRoutes:
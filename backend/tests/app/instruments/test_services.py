@@ -72,16 +72,17 @@ class TestInstrumentServiceCreate:
         assert hasattr(service, "create")
         assert inspect.iscoroutinefunction(service.create)
 
-        # Mock the session methods
+        # Mock the instrument row returned by the INSERT statement
         mock_instrument = MagicMock(spec=Instrument)
         mock_instrument.serial_number = sample_instrument_create.serial_number
-        mock_session.add = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one = MagicMock(return_value=mock_instrument)
+        mock_session.exec = AsyncMock(return_value=mock_result)
         mock_session.commit = AsyncMock()
         mock_session.refresh = AsyncMock()
 
-        # Mock Instrument.model_validate to return our mock
-        with patch.object(Instrument, "model_validate", return_value=mock_instrument), patch.object(InstrumentRead, "model_validate") as mock_read:
-            mock_read.return_value = InstrumentRead(
+        with patch.object(services, "INSTRUMENT_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = InstrumentRead(
                 id=1,
                 brand=sample_instrument_create.brand,
                 type=sample_instrument_create.type,
@@ -93,25 +94,27 @@ class TestInstrumentServiceCreate:
 
             assert result is not None
             assert result.serial_number == sample_instrument_create.serial_number
-            mock_session.add.assert_called_once_with(mock_instrument)
+            mock_session.exec.assert_called_once()
+            mock_adapter.validate_python.assert_called_once_with(mock_instrument, from_attributes=True)
             mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once_with(mock_instrument)
+            mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_instrument_success(self, mock_session: AsyncMock, sample_instrument_create: InstrumentCreate) -> None:
-        """Test successful creation of an instrument."""
+        """Test successful creation of an instrument with a single INSERT ... RETURNING."""
         service = services.InstrumentService(session=mock_session)
 
-        # Mock the session methods
+        # Mock the instrument row returned by the INSERT statement
         mock_instrument = MagicMock(spec=Instrument)
         mock_instrument.serial_number = sample_instrument_create.serial_number
-        mock_session.add = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one = MagicMock(return_value=mock_instrument)
+        mock_session.exec = AsyncMock(return_value=mock_result)
         mock_session.commit = AsyncMock()
         mock_session.refresh = AsyncMock()
 
-        # Mock Instrument.model_validate to return our mock
-        with patch.object(Instrument, "model_validate", return_value=mock_instrument), patch.object(InstrumentRead, "model_validate") as mock_read:
-            mock_read.return_value = InstrumentRead(
+        with patch.object(services, "INSTRUMENT_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = InstrumentRead(
                 id=1,
                 brand=sample_instrument_create.brand,
                 type=sample_instrument_create.type,
@@ -123,9 +126,10 @@ class TestInstrumentServiceCreate:
 
             assert result is not None
             assert result.serial_number == sample_instrument_create.serial_number
-            mock_session.add.assert_called_once_with(mock_instrument)
+            mock_session.exec.assert_called_once()
+            mock_adapter.validate_python.assert_called_once_with(mock_instrument, from_attributes=True)
             mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once_with(mock_instrument)
+            mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_instrument_duplicate_serial_number(self, mock_session: AsyncMock, sample_instrument_create: InstrumentCreate) -> None:
@@ -133,17 +137,80 @@ class TestInstrumentServiceCreate:
         service = services.InstrumentService(session=mock_session)
 
         # Mock the session to raise IntegrityError
-        mock_instrument = MagicMock(spec=Instrument)
-        mock_session.add = MagicMock()
-        mock_session.commit = AsyncMock(side_effect=IntegrityError("Duplicate entry", "INSERT", ValueError("Unique constraint violation")))
+        mock_session.exec = AsyncMock(side_effect=IntegrityError("Duplicate entry", "INSERT", ValueError("Unique constraint violation")))
+        mock_session.commit = AsyncMock()
         mock_session.rollback = AsyncMock()
 
-        with patch.object(Instrument, "model_validate", return_value=mock_instrument):
-            with pytest.raises(InstrumentAlreadyExistError) as exc_info:
-                await service.create(sample_instrument_create)
+        with pytest.raises(InstrumentAlreadyExistError) as exc_info:
+            await service.create(sample_instrument_create)
+
+        assert sample_instrument_create.serial_number in str(exc_info.value)
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
 
-            assert sample_instrument_create.serial_number in str(exc_info.value)
-            mock_session.rollback.assert_called_once()
+    @pytest.mark.asyncio
+    async def test_create_many_instruments_success(self, mock_session: AsyncMock, sample_instrument_create: InstrumentCreate) -> None:
+        """Test that several instruments are created with a single INSERT ... RETURNING."""
+        service = services.InstrumentService(session=mock_session)
+
+        mock_instruments = [MagicMock(spec=Instrument), MagicMock(spec=Instrument)]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = mock_instruments
+        mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.commit = AsyncMock()
+
+        with patch.object(services, "INSTRUMENT_READ_LIST_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = ["first", "second"]
+            result = await service.create_many([sample_instrument_create, sample_instrument_create])
+
+        assert result == ["first", "second"]
+        mock_session.exec.assert_called_once()
+        assert mock_session.exec.call_args.kwargs["params"] == [sample_instrument_create.model_dump(), sample_instrument_create.model_dump()]
+        mock_adapter.validate_python.assert_called_once_with(mock_instruments, from_attributes=True)
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_many_instruments_empty(self, mock_session: AsyncMock) -> None:
+        """Test that an empty batch does not touch the database."""
+        service = services.InstrumentService(session=mock_session)
+
+        assert await service.create_many([]) == []
+        mock_session.exec.assert_not_called()
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_many_instruments_existing_serial_number(self, mock_session: AsyncMock, sample_instrument_create: InstrumentCreate) -> None:
+        """Test that the serial number already stored is reported when the batch is rejected."""
+        service = services.InstrumentService(session=mock_session)
+
+        mock_lookup = MagicMock()
+        mock_lookup.first.return_value = sample_instrument_create.serial_number
+        mock_session.exec = AsyncMock(side_effect=[IntegrityError("Duplicate entry", "INSERT", ValueError("Unique constraint violation")), mock_lookup])
+        mock_session.rollback = AsyncMock()
+
+        with pytest.raises(InstrumentAlreadyExistError) as exc_info:
+            await service.create_many([sample_instrument_create])
+
+        assert sample_instrument_create.serial_number in str(exc_info.value)
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_many_instruments_repeated_serial_number(self, mock_session: AsyncMock, sample_instrument_create: InstrumentCreate) -> None:
+        """Test that a serial number repeated inside the batch is reported when none is stored yet."""
+        service = services.InstrumentService(session=mock_session)
+
+        other_instrument_create = sample_instrument_create.model_copy(update={"serial_number": "SN654321"})
+        mock_lookup = MagicMock()
+        mock_lookup.first.return_value = None
+        mock_session.exec = AsyncMock(side_effect=[IntegrityError("Duplicate entry", "INSERT", ValueError("Unique constraint violation")), mock_lookup])
+        mock_session.rollback = AsyncMock()
+
+        with pytest.raises(InstrumentAlreadyExistError) as exc_info:
+            await service.create_many([other_instrument_create, sample_instrument_create, sample_instrument_create])
+
+        assert sample_instrument_create.serial_number in str(exc_info.value)
+        mock_session.rollback.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_get_instrument_success(self, mock_session: AsyncMock, sample_instrument_read: InstrumentRead) -> None:
@@ -151,25 +218,22 @@ class TestInstrumentServiceCreate:
         service = services.InstrumentService(session=mock_session)
 
         mock_instrument = MagicMock(spec=Instrument)
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=mock_instrument)
-        mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.get = AsyncMock(return_value=mock_instrument)
 
-        with patch.object(InstrumentRead, "model_validate", return_value=sample_instrument_read):
+        with patch.object(services, "INSTRUMENT_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = sample_instrument_read
             result = await service.get(1)
 
             assert result is not None
             assert result.id == sample_instrument_read.id
-            mock_session.exec.assert_called_once()
+            mock_session.get.assert_called_once_with(Instrument, 1)
 
     @pytest.mark.asyncio
     async def test_get_instrument_not_found(self, mock_session: AsyncMock) -> None:
         """Test retrieval fails when instrument is not found."""
         service = services.InstrumentService(session=mock_session)
 
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=None)
-        mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.get = AsyncMock(return_value=None)
 
         with pytest.raises(InstrumentNotFoundError) as exc_info:
             await service.get(999)
@@ -178,24 +242,24 @@ class TestInstrumentServiceCreate:
 
     @pytest.mark.asyncio
     async def test_update_instrument_success(self, mock_session: AsyncMock) -> None:
-        """Test successful update of an instrument."""
+        """Test successful update of an instrument with a single UPDATE ... RETURNING."""
         service = services.InstrumentService(session=mock_session)
 
-        # Setup mock instrument
+        # Setup mock instrument returned by the UPDATE statement
         mock_instrument = MagicMock(spec=Instrument)
         mock_instrument.serial_number = "SN123456"
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=mock_instrument)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none = MagicMock(return_value=mock_instrument)
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=True)))
         mock_session.exec = AsyncMock(return_value=mock_result)
-        mock_session.add = MagicMock()
         mock_session.commit = AsyncMock()
         mock_session.refresh = AsyncMock()
 
         # Create update data
         update_data = InstrumentUpdate(model="MS2024A")
 
-        with patch.object(InstrumentRead, "model_validate") as mock_read:
-            mock_read.return_value = InstrumentRead(
+        with patch.object(services, "INSTRUMENT_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = InstrumentRead(
                 id=1,
                 brand=InstrumentBrand.ANRITSU,
                 type=InstrumentType.SPECTRUM_ANALYZER,
@@ -207,17 +271,40 @@ class TestInstrumentServiceCreate:
 
             assert result is not None
             assert result.model == "MS2024A"
+            mock_session.exec.assert_called_once()
+            mock_session.commit.assert_called_once()
+            mock_session.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_instrument_success_without_returning(self, mock_session: AsyncMock) -> None:
+        """Test update reads the row back when the dialect has no UPDATE ... RETURNING."""
+        service = services.InstrumentService(session=mock_session)
+
+        mock_instrument = MagicMock(spec=Instrument)
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=False)))
+        mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.get = AsyncMock(return_value=mock_instrument)
+        mock_session.commit = AsyncMock()
+
+        with patch.object(services, "INSTRUMENT_READ_ADAPTER") as mock_adapter:
+            await service.update(1, InstrumentUpdate(model="MS2024A"))
+
+            mock_session.get.assert_called_once_with(Instrument, 1, populate_existing=True)
+            mock_adapter.validate_python.assert_called_once_with(mock_instrument, from_attributes=True)
             mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_update_instrument_not_found(self, mock_session: AsyncMock) -> None:
         """Test update fails when instrument is not found."""
         service = services.InstrumentService(session=mock_session)
 
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=None)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none = MagicMock(return_value=None)
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=True)))
         mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.commit = AsyncMock()
 
         update_data = InstrumentUpdate(model="MS2024A")
 
@@ -225,27 +312,40 @@ class TestInstrumentServiceCreate:
             await service.update(999, update_data)
 
         assert "999" in str(exc_info.value)
+        mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_instrument_duplicate_serial_number(self, mock_session: AsyncMock) -> None:
         """Test update fails when changing to a duplicate serial number."""
         service = services.InstrumentService(session=mock_session)
 
-        # Setup mock instrument
-        mock_instrument = MagicMock(spec=Instrument)
-        mock_instrument.serial_number = "SN789012"
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=mock_instrument)
-        mock_session.exec = AsyncMock(return_value=mock_result)
-        mock_session.add = MagicMock()
-        mock_session.commit = AsyncMock(side_effect=IntegrityError("Duplicate entry", "INSERT", ValueError("Unique constraint violation")))
+        mock_lookup = MagicMock()
+        mock_lookup.first = MagicMock(return_value=2)
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=True)))
+        mock_session.exec = AsyncMock(side_effect=[IntegrityError("Duplicate entry", "UPDATE", ValueError("Unique constraint violation")), mock_lookup])
         mock_session.rollback = AsyncMock()
 
         update_data = InstrumentUpdate(serial_number="SN789012")
 
-        with pytest.raises(InstrumentAlreadyExistError):
+        with pytest.raises(InstrumentAlreadyExistError) as exc_info:
             await service.update(1, update_data)
 
+        assert "SN789012" in str(exc_info.value)
+        mock_session.rollback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_instrument_other_integrity_error(self, mock_session: AsyncMock) -> None:
+        """Test update re-raises constraint violations unrelated to the serial number."""
+        service = services.InstrumentService(session=mock_session)
+
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=True)))
+        mock_session.exec = AsyncMock(side_effect=IntegrityError("Column cannot be null", "UPDATE", ValueError("Not null constraint violation")))
+        mock_session.rollback = AsyncMock()
+
+        with pytest.raises(IntegrityError):
+            await service.update(1, InstrumentUpdate(model=None))
+
+        mock_session.exec.assert_called_once()
         mock_session.rollback.assert_called_once()
 
     @pytest.mark.asyncio
@@ -253,16 +353,15 @@ class TestInstrumentServiceCreate:
         """Test successful deletion of an instrument."""
         service = services.InstrumentService(session=mock_session)
 
-        mock_instrument = MagicMock(spec=Instrument)
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=mock_instrument)
+        mock_result = MagicMock()
+        mock_result.first = MagicMock(return_value=(1,))
         mock_session.exec = AsyncMock(return_value=mock_result)
-        mock_session.delete = AsyncMock()
         mock_session.commit = AsyncMock()
 
         await service.delete(1)
 
-        mock_session.delete.assert_called_once_with(mock_instrument)
+        mock_session.exec.assert_called_once()
+        mock_session.delete.assert_not_called()
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
@@ -270,14 +369,16 @@ class TestInstrumentServiceCreate:
         """Test deletion fails when instrument is not found."""
         service = services.InstrumentService(session=mock_session)
 
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=None)
+        mock_result = MagicMock()
+        mock_result.first = MagicMock(return_value=None)
         mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.commit = AsyncMock()
 
         with pytest.raises(InstrumentNotFoundError) as exc_info:
             await service.delete(999)
 
         assert "999" in str(exc_info.value)
+        mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_gets_instruments_empty(self, mock_session: AsyncMock) -> None:
@@ -314,8 +415,11 @@ class TestInstrumentServiceCreate:
             for i in range(EXPECTED_INSTRUMENTS_COUNT)
         ]
 
-        with patch.object(InstrumentRead, "model_validate", side_effect=expected_reads):
+        with patch.object(services, "INSTRUMENT_READ_LIST_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = expected_reads
             result = await service.gets()
 
+            mock_adapter.validate_python.assert_called_once_with(mock_instruments, from_attributes=True)
+
             assert len(result) == EXPECTED_INSTRUMENTS_COUNT
             assert all(isinstance(item, InstrumentRead) for item in result)
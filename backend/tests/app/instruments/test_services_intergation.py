@@ -9,8 +9,10 @@ from collections.abc import AsyncGenerator
 import pytest
 import pytest_asyncio
 from app.api.instruments.constants import InstrumentBrand, InstrumentType
-from app.api.instruments.schemas import InstrumentCreate
+from app.api.instruments.exceptions import InstrumentAlreadyExistError, InstrumentNotFoundError
+from app.api.instruments.schemas import InstrumentCreate, InstrumentUpdate
 from app.api.instruments.services import InstrumentService
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel
@@ -92,3 +94,113 @@ class TestInstrumentServiceIntegration:
         second_result = await service.create(instrument_data_2)
         assert second_result.id is not None
         assert first_result.id != second_result.id
+
+    @pytest.mark.asyncio
+    async def test_duplicate_serial_number_rejected(self, async_session_test: AsyncSession) -> None:
+        """Test that the unique constraint rejects a second instrument with the same serial number."""
+        service = InstrumentService(session=async_session_test)
+
+        instrument_data = InstrumentCreate(brand=InstrumentBrand.ANRITSU, type=InstrumentType.SPECTRUM_ANALYZER, model="MS2023A", serial_number="SN123456")
+        await service.create(instrument_data)
+
+        with pytest.raises(InstrumentAlreadyExistError, match="SN123456"):
+            await service.create(instrument_data)
+        with pytest.raises(InstrumentAlreadyExistError, match="SN123456"):
+            await service.create_many([instrument_data.model_copy(update={"serial_number": "SN654321"}), instrument_data])
+        assert [instrument.serial_number for instrument in await service.gets()] == ["SN123456"]
+
+    @pytest.mark.asyncio
+    async def test_create_many_instruments(self, async_session_test: AsyncSession) -> None:
+        """Test that a batch of instruments is created in one call and returned in input order."""
+        service = InstrumentService(session=async_session_test)
+
+        created = await service.create_many(
+            [InstrumentCreate(brand=InstrumentBrand.KEYSIGHT, type=InstrumentType.OSCILLOSCOPE, model="UXR", serial_number=f"SN{index:06d}") for index in range(3)]
+        )
+
+        assert [instrument.serial_number for instrument in created] == ["SN000000", "SN000001", "SN000002"]
+        assert [instrument.serial_number for instrument in await service.gets()] == ["SN000000", "SN000001", "SN000002"]
+        assert await service.create_many([]) == []
+
+    @pytest.mark.asyncio
+    async def test_delete_instrument(self, async_session_test: AsyncSession) -> None:
+        """Test deleting an instrument removes it and a second delete reports not found."""
+        service = InstrumentService(session=async_session_test)
+
+        instrument_data = InstrumentCreate(
+            brand=InstrumentBrand.TEKTRONIX,
+            type=InstrumentType.OSCILLOSCOPE,
+            model="MSO64",
+            serial_number="SN555555",
+        )
+        created = await service.create(instrument_data)
+
+        await service.delete(created.id)
+
+        with pytest.raises(InstrumentNotFoundError):
+            await service.get(created.id)
+        with pytest.raises(InstrumentNotFoundError):
+            await service.delete(created.id)
+
+    @pytest.mark.asyncio
+    async def test_gets_instruments_paginated(self, async_session_test: AsyncSession) -> None:
+        """Test that instruments are listed page by page using the last ID as cursor."""
+        service = InstrumentService(session=async_session_test)
+
+        for index in range(5):
+            await service.create(
+                InstrumentCreate(
+                    brand=InstrumentBrand.KEYSIGHT,
+                    type=InstrumentType.DIGITAL_MULTIMETER,
+                    model="34465A",
+                    serial_number=f"SN{index:06d}",
+                )
+            )
+
+        first_page = await service.gets(limit=2)
+        second_page = await service.gets(limit=2, cursor=first_page[-1].id)
+        last_page = await service.gets(limit=2, cursor=second_page[-1].id)
+
+        assert [instrument.serial_number for instrument in first_page] == ["SN000000", "SN000001"]
+        assert [instrument.serial_number for instrument in second_page] == ["SN000002", "SN000003"]
+        assert [instrument.serial_number for instrument in last_page] == ["SN000004"]
+
+    @pytest.mark.asyncio
+    async def test_update_instrument(self, async_session_test: AsyncSession) -> None:
+        """Test partial updates and updates of missing instruments."""
+        service = InstrumentService(session=async_session_test)
+
+        first = await service.create(
+            InstrumentCreate(brand=InstrumentBrand.ANRITSU, type=InstrumentType.SPECTRUM_ANALYZER, model="MS2023A", serial_number="SN111111"),
+        )
+
+        updated = await service.update(first.id, InstrumentUpdate(model="MS2024A", brand=InstrumentBrand.TEKTRONIX))
+        assert updated.model == "MS2024A"
+        assert updated.brand == InstrumentBrand.TEKTRONIX
+        assert updated.serial_number == "SN111111"
+        assert (await service.get(first.id)).model == "MS2024A"
+
+        with pytest.raises(InstrumentNotFoundError):
+            await service.update(999, InstrumentUpdate(model="MS2024A"))
+
+    @pytest.mark.asyncio
+    async def test_update_instrument_integrity_errors(self, async_session_test: AsyncSession) -> None:
+        """Test that only a serial number held by another instrument is reported as a duplicate."""
+        service = InstrumentService(session=async_session_test)
+
+        first = await service.create(
+            InstrumentCreate(brand=InstrumentBrand.ANRITSU, type=InstrumentType.SPECTRUM_ANALYZER, model="MS2023A", serial_number="SN111111"),
+        )
+        await service.create(
+            InstrumentCreate(brand=InstrumentBrand.ANRITSU, type=InstrumentType.SPECTRUM_ANALYZER, model="MS2023A", serial_number="SN222222"),
+        )
+
+        with pytest.raises(InstrumentAlreadyExistError) as exc_info:
+            await service.update(first.id, InstrumentUpdate(serial_number="SN222222"))
+        assert "SN222222" in str(exc_info.value)
+
+        # A PATCH that does not touch the serial number is not a duplicate
+        with pytest.raises(IntegrityError):
+            await service.update(first.id, InstrumentUpdate(model=None))
+
+        assert (await service.get(first.id)).serial_number == "SN111111"
@@ -3,6 +3,7 @@
 import pytest
 from app.api.locations import models
 from pydantic import ValidationError
+from sqlalchemy import UniqueConstraint
 
 
 class TestLocationModel:
@@ -13,6 +14,12 @@ class TestLocationModel:
         assert models is not None
         assert hasattr(models, "Location")
 
+    def test_location_address_is_unique(self) -> None:
+        """Test that address, postal code and city are unique together."""
+        unique_columns = [[column.name for column in constraint.columns] for constraint in models.Location.__table__.constraints if isinstance(constraint, UniqueConstraint)]
+
+        assert unique_columns == [["address", "postal_code", "city"]]
+
     @pytest.mark.parametrize(
         "location",
         [
@@ -3,7 +3,8 @@
 This file contains tests for location API routes.
 """
 
-from unittest.mock import AsyncMock
+import json
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from app.api.locations import routes
@@ -17,7 +18,9 @@ from app.api.locations.schemas import (
     LocationUpdate,
 )
 from app.api.locations.services import LocationService
-from fastapi import HTTPException, status
+from app.core.etag import compute_etag
+from fastapi import HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 # Constants for testing
@@ -30,6 +33,14 @@ def mock_session() -> AsyncMock:
     return AsyncMock(spec=AsyncSession)
 
 
+@pytest.fixture
+def mock_request() -> MagicMock:
+    """Create a mock request without conditional headers."""
+    request = MagicMock(spec=Request)
+    request.headers = {}
+    return request
+
+
 @pytest.fixture
 def mock_service() -> AsyncMock:
     """Create a mock LocationService."""
@@ -136,7 +147,7 @@ class TestGetLocationRoutes:
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
 
     @pytest.mark.asyncio
-    async def test_get_locations_success(self, mock_service: AsyncMock) -> None:
+    async def test_get_locations_success(self, mock_service: AsyncMock, mock_request: MagicMock) -> None:
         """Test successful listing of all locations."""
         all_locations = [
             LocationRead(
@@ -152,11 +163,37 @@ class TestGetLocationRoutes:
 
         mock_service.gets.return_value = all_locations
 
-        result = await routes.get_locations(mock_service)
+        result = await routes.get_locations(mock_service, mock_request, limit=10, cursor=5)
+
+        assert result.media_type == "application/json"
+        assert json.loads(result.body) == [location.model_dump(mode="json") for location in all_locations]
+        assert len(json.loads(result.body)) == EXPECTED_LOCATIONS_COUNT
+        assert result.headers["ETag"] == compute_etag(result.body)
+        mock_service.gets.assert_called_once_with(limit=10, cursor=5)
+
+    @pytest.mark.asyncio
+    async def test_get_locations_not_modified(self, mock_service: AsyncMock, mock_request: MagicMock) -> None:
+        """Test that a matching If-None-Match header yields a 304 without body."""
+        mock_service.gets.return_value = []
+        etag = compute_etag(b"[]")
+        mock_request.headers = {"if-none-match": etag}
+
+        result = await routes.get_locations(mock_service, mock_request)
+
+        assert result.status_code == status.HTTP_304_NOT_MODIFIED
+        assert result.body == b""
+        assert result.headers["ETag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_stream_locations(self, mock_service: AsyncMock) -> None:
+        """Test that locations are streamed as newline-delimited JSON."""
+        mock_service.stream = MagicMock(return_value=iter([b'{"id":1}\n']))
+
+        response = await routes.stream_locations(mock_service, cursor=5)
 
-        assert len(result) == EXPECTED_LOCATIONS_COUNT
-        assert all(isinstance(item, LocationRead) for item in result)
-        mock_service.gets.assert_called_once()
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "application/x-ndjson"
+        mock_service.stream.assert_called_once_with(cursor=5)
 
 
 class TestUpdateLocationRoutes:
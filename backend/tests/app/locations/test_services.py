@@ -73,16 +73,17 @@ class TestLocationServiceCreate:
         assert hasattr(service, "create")
         assert inspect.iscoroutinefunction(service.create)
 
-        # Mock the session methods
+        # Mock the location row returned by the INSERT statement
         mock_location = MagicMock(spec=Location)
         mock_location.address = sample_location_create.address
-        mock_session.add = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one = MagicMock(return_value=mock_location)
+        mock_session.exec = AsyncMock(return_value=mock_result)
         mock_session.commit = AsyncMock()
         mock_session.refresh = AsyncMock()
 
-        # Mock Location.model_validate to return our mock
-        with patch.object(Location, "model_validate", return_value=mock_location), patch.object(LocationRead, "model_validate") as mock_read:
-            mock_read.return_value = LocationRead(
+        with patch.object(services, "LOCATION_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = LocationRead(
                 id=1,
                 address=sample_location_create.address,
                 postal_code=sample_location_create.postal_code,
@@ -95,25 +96,27 @@ class TestLocationServiceCreate:
 
             assert result is not None
             assert result.address == sample_location_create.address
-            mock_session.add.assert_called_once_with(mock_location)
+            mock_session.exec.assert_called_once()
+            mock_adapter.validate_python.assert_called_once_with(mock_location, from_attributes=True)
             mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once_with(mock_location)
+            mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_location_success(self, mock_session: AsyncMock, sample_location_create: LocationCreate) -> None:
-        """Test successful creation of a location."""
+        """Test successful creation of a location with a single INSERT ... RETURNING."""
         service = services.LocationService(session=mock_session)
 
-        # Mock the session methods
+        # Mock the location row returned by the INSERT statement
         mock_location = MagicMock(spec=Location)
         mock_location.address = sample_location_create.address
-        mock_session.add = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalar_one = MagicMock(return_value=mock_location)
+        mock_session.exec = AsyncMock(return_value=mock_result)
         mock_session.commit = AsyncMock()
         mock_session.refresh = AsyncMock()
 
-        # Mock Location.model_validate to return our mock
-        with patch.object(Location, "model_validate", return_value=mock_location), patch.object(LocationRead, "model_validate") as mock_read:
-            mock_read.return_value = LocationRead(
+        with patch.object(services, "LOCATION_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = LocationRead(
                 id=1,
                 address=sample_location_create.address,
                 postal_code=sample_location_create.postal_code,
@@ -126,9 +129,10 @@ class TestLocationServiceCreate:
 
             assert result is not None
             assert result.address == sample_location_create.address
-            mock_session.add.assert_called_once_with(mock_location)
+            mock_session.exec.assert_called_once()
+            mock_adapter.validate_python.assert_called_once_with(mock_location, from_attributes=True)
             mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once_with(mock_location)
+            mock_session.refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_create_location_duplicate_address(self, mock_session: AsyncMock, sample_location_create: LocationCreate) -> None:
@@ -136,20 +140,19 @@ class TestLocationServiceCreate:
         service = services.LocationService(session=mock_session)
 
         # Mock the session to raise IntegrityError
-        mock_location = MagicMock(spec=Location)
-        mock_session.add = MagicMock()
-        mock_session.commit = AsyncMock(side_effect=IntegrityError("Duplicate entry", "INSERT", ValueError("Unique constraint violation")))
+        mock_session.exec = AsyncMock(side_effect=IntegrityError("Duplicate entry", "INSERT", ValueError("Unique constraint violation")))
+        mock_session.commit = AsyncMock()
         mock_session.rollback = AsyncMock()
 
-        with patch.object(Location, "model_validate", return_value=mock_location):
-            with pytest.raises(LocationAlreadyExistError) as exc_info:
-                await service.create(sample_location_create)
+        with pytest.raises(LocationAlreadyExistError) as exc_info:
+            await service.create(sample_location_create)
 
-            # Error message should contain the combination of address, postal_code, and city
-            assert sample_location_create.address in str(exc_info.value)
-            assert sample_location_create.postal_code in str(exc_info.value)
-            assert sample_location_create.city in str(exc_info.value)
-            mock_session.rollback.assert_called_once()
+        # Error message should contain the combination of address, postal_code, and city
+        assert sample_location_create.address in str(exc_info.value)
+        assert sample_location_create.postal_code in str(exc_info.value)
+        assert sample_location_create.city in str(exc_info.value)
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_location_success(self, mock_session: AsyncMock, sample_location_read: LocationRead) -> None:
@@ -157,25 +160,22 @@ class TestLocationServiceCreate:
         service = services.LocationService(session=mock_session)
 
         mock_location = MagicMock(spec=Location)
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=mock_location)
-        mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.get = AsyncMock(return_value=mock_location)
 
-        with patch.object(LocationRead, "model_validate", return_value=sample_location_read):
+        with patch.object(services, "LOCATION_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = sample_location_read
             result = await service.get(1)
 
             assert result is not None
             assert result.id == sample_location_read.id
-            mock_session.exec.assert_called_once()
+            mock_session.get.assert_called_once_with(Location, 1)
 
     @pytest.mark.asyncio
     async def test_get_location_not_found(self, mock_session: AsyncMock) -> None:
         """Test retrieval fails when location is not found."""
         service = services.LocationService(session=mock_session)
 
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=None)
-        mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.get = AsyncMock(return_value=None)
 
         with pytest.raises(LocationNotFoundError) as exc_info:
             await service.get(999)
@@ -184,24 +184,24 @@ class TestLocationServiceCreate:
 
     @pytest.mark.asyncio
     async def test_update_location_success(self, mock_session: AsyncMock) -> None:
-        """Test successful update of a location."""
+        """Test successful update of a location with a single UPDATE ... RETURNING."""
         service = services.LocationService(session=mock_session)
 
-        # Setup mock location
+        # Setup mock location returned by the UPDATE statement
         mock_location = MagicMock(spec=Location)
         mock_location.address = "123 Main Street"
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=mock_location)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none = MagicMock(return_value=mock_location)
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=True)))
         mock_session.exec = AsyncMock(return_value=mock_result)
-        mock_session.add = MagicMock()
         mock_session.commit = AsyncMock()
         mock_session.refresh = AsyncMock()
 
         # Create update data
         update_data = LocationUpdate(city="Lyon")
 
-        with patch.object(LocationRead, "model_validate") as mock_read:
-            mock_read.return_value = LocationRead(
+        with patch.object(services, "LOCATION_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = LocationRead(
                 id=1,
                 address="123 Main Street",
                 postal_code="75001",
@@ -214,17 +214,65 @@ class TestLocationServiceCreate:
 
             assert result is not None
             assert result.city == "Lyon"
+            mock_session.exec.assert_called_once()
+            mock_session.commit.assert_called_once()
+            mock_session.refresh.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_location_success_without_returning(self, mock_session: AsyncMock) -> None:
+        """Test update reads the row back when the dialect has no UPDATE ... RETURNING."""
+        service = services.LocationService(session=mock_session)
+
+        mock_location = MagicMock(spec=Location)
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=False)))
+        mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.get = AsyncMock(return_value=mock_location)
+        mock_session.commit = AsyncMock()
+
+        with patch.object(services, "LOCATION_READ_ADAPTER") as mock_adapter:
+            await service.update(1, LocationUpdate(city="Lyon"))
+
+            mock_session.get.assert_called_once_with(Location, 1, populate_existing=True)
+            mock_adapter.validate_python.assert_called_once_with(mock_location, from_attributes=True)
             mock_session.commit.assert_called_once()
-            mock_session.refresh.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_update_location_without_changes(self, mock_session: AsyncMock) -> None:
+        """Test that an empty update returns the location without committing."""
+        service = services.LocationService(session=mock_session)
+
+        mock_location = MagicMock(spec=Location)
+        mock_session.get = AsyncMock(return_value=mock_location)
+        mock_session.commit = AsyncMock()
+
+        with patch.object(services, "LOCATION_READ_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = LocationRead(
+                id=1,
+                address="123 Main Street",
+                postal_code="75001",
+                city="Paris",
+                state="Île-de-France",
+                country="France",
+            )
+
+            result = await service.update(1, LocationUpdate())
+
+            assert result.city == "Paris"
+            mock_adapter.validate_python.assert_called_once_with(mock_location, from_attributes=True)
+            mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_location_not_found(self, mock_session: AsyncMock) -> None:
         """Test update fails when location is not found."""
         service = services.LocationService(session=mock_session)
 
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=None)
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none = MagicMock(return_value=None)
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=True)))
         mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.commit = AsyncMock()
 
         update_data = LocationUpdate(city="Lyon")
 
@@ -232,27 +280,29 @@ class TestLocationServiceCreate:
             await service.update(999, update_data)
 
         assert "999" in str(exc_info.value)
+        mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_location_duplicate_address(self, mock_session: AsyncMock) -> None:
         """Test update fails when changing to a duplicate address."""
         service = services.LocationService(session=mock_session)
 
-        # Setup mock location
+        # Setup the stored location, used to complete the conflicting composite key
         mock_location = MagicMock(spec=Location)
         mock_location.address = "123 Main Street"
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=mock_location)
-        mock_session.exec = AsyncMock(return_value=mock_result)
-        mock_session.add = MagicMock()
-        mock_session.commit = AsyncMock(side_effect=IntegrityError("Duplicate entry", "INSERT", ValueError("Unique constraint violation")))
+        mock_location.postal_code = "75001"
+        mock_location.city = "Paris"
+        mock_session.get_bind = MagicMock(return_value=MagicMock(dialect=MagicMock(update_returning=True)))
+        mock_session.exec = AsyncMock(side_effect=IntegrityError("Duplicate entry", "UPDATE", ValueError("Unique constraint violation")))
+        mock_session.get = AsyncMock(return_value=mock_location)
         mock_session.rollback = AsyncMock()
 
         update_data = LocationUpdate(address="456 Oak Avenue")
 
-        with pytest.raises(LocationAlreadyExistError):
+        with pytest.raises(LocationAlreadyExistError) as exc_info:
             await service.update(1, update_data)
 
+        assert "456 Oak Avenue, 75001, Paris" in str(exc_info.value)
         mock_session.rollback.assert_called_once()
 
     @pytest.mark.asyncio
@@ -260,16 +310,15 @@ class TestLocationServiceCreate:
         """Test successful deletion of a location."""
         service = services.LocationService(session=mock_session)
 
-        mock_location = MagicMock(spec=Location)
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=mock_location)
+        mock_result = MagicMock()
+        mock_result.first = MagicMock(return_value=(1,))
         mock_session.exec = AsyncMock(return_value=mock_result)
-        mock_session.delete = AsyncMock()
         mock_session.commit = AsyncMock()
 
         await service.delete(1)
 
-        mock_session.delete.assert_called_once_with(mock_location)
+        mock_session.exec.assert_called_once()
+        mock_session.delete.assert_not_called()
         mock_session.commit.assert_called_once()
 
     @pytest.mark.asyncio
@@ -277,14 +326,16 @@ class TestLocationServiceCreate:
         """Test deletion fails when location is not found."""
         service = services.LocationService(session=mock_session)
 
-        mock_result = AsyncMock()
-        mock_result.one_or_none = MagicMock(return_value=None)
+        mock_result = MagicMock()
+        mock_result.first = MagicMock(return_value=None)
         mock_session.exec = AsyncMock(return_value=mock_result)
+        mock_session.commit = AsyncMock()
 
         with pytest.raises(LocationNotFoundError) as exc_info:
             await service.delete(999)
 
         assert "999" in str(exc_info.value)
+        mock_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_gets_locations_empty(self, mock_session: AsyncMock) -> None:
@@ -323,8 +374,11 @@ class TestLocationServiceCreate:
             for i in range(EXPECTED_LOCATIONS_COUNT)
         ]
 
-        with patch.object(LocationRead, "model_validate", side_effect=expected_reads):
+        with patch.object(services, "LOCATION_READ_LIST_ADAPTER") as mock_adapter:
+            mock_adapter.validate_python.return_value = expected_reads
             result = await service.gets()
 
+            mock_adapter.validate_python.assert_called_once_with(mock_locations, from_attributes=True)
+
             assert len(result) == EXPECTED_LOCATIONS_COUNT
             assert all(isinstance(item, LocationRead) for item in result)
@@ -8,6 +8,7 @@ from collections.abc import AsyncGenerator
 
 import pytest
 import pytest_asyncio
+from app.api.locations.exceptions import LocationAlreadyExistError
 from app.api.locations.schemas import LocationCreate, LocationUpdate
 from app.api.locations.services import LocationService
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -93,6 +94,21 @@ class TestLocationServiceIntegration:
         assert second_result.id is not None
         assert first_result.id != second_result.id
 
+    @pytest.mark.asyncio
+    async def test_duplicate_location_rejected(self, async_session_test: AsyncSession) -> None:
+        """Test that the same address, postal code and city cannot be stored twice."""
+        service = LocationService(session=async_session_test)
+
+        location_data = LocationCreate(address="123 Main Street", postal_code="75001", city="Paris", state="Île-de-France", country="France")
+        await service.create(location_data)
+        other = await service.create(location_data.model_copy(update={"city": "Lyon"}))
+
+        with pytest.raises(LocationAlreadyExistError, match="123 Main Street, 75001, Paris"):
+            await service.create(location_data)
+        with pytest.raises(LocationAlreadyExistError, match="123 Main Street, 75001, Paris"):
+            await service.update(other.id, LocationUpdate(city="Paris"))
+        assert (await service.get(other.id)).city == "Lyon"
+
     @pytest.mark.asyncio
     async def test_get_all_locations(self, async_session_test: AsyncSession) -> None:
         """Test retrieving all locations from the database."""
@@ -122,6 +138,19 @@ class TestLocationServiceIntegration:
         all_locations = await service.gets()
         assert len(all_locations) == EXPECTED_LOCATIONS_COUNT_IN_TEST
 
+    @pytest.mark.asyncio
+    async def test_stream_locations(self, async_session_test: AsyncSession) -> None:
+        """Test streaming locations as newline-delimited JSON, starting after a cursor."""
+        service = LocationService(session=async_session_test)
+
+        created = [
+            await service.create(LocationCreate(address=f"{index} Main Street", postal_code="75001", city="Paris", state="Île-de-France", country="France")) for index in range(3)
+        ]
+
+        lines = [line async for line in service.stream()]
+        assert lines == [location.model_dump_json().encode() + b"\n" for location in created]
+        assert [line async for line in service.stream(cursor=created[0].id)] == lines[1:]
+
     @pytest.mark.asyncio
     async def test_update_location(self, async_session_test: AsyncSession) -> None:
         """Test updating a location with real database."""
@@ -0,0 +1 @@
+"""ELIMS - Backend APP Temperature Tests."""
@@ -0,0 +1,31 @@
+"""Tests routes for the API temperature module.
+
+This file contains tests for temperature API routes.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.api.temperature import routes
+from fastapi.responses import StreamingResponse
+
+
+@pytest.fixture
+def mock_service() -> AsyncMock:
+    """Create a mock TemperatureService."""
+    return AsyncMock()
+
+
+class TestGetTemperatureRoutes:
+    """Tests for get temperature endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_stream_temperatures(self, mock_service: AsyncMock) -> None:
+        """Test that temperature records are streamed as newline-delimited JSON."""
+        mock_service.stream = MagicMock(return_value=iter([b'{"id":1}\n']))
+
+        response = await routes.stream_temperatures(mock_service, cursor=5)
+
+        assert isinstance(response, StreamingResponse)
+        assert response.media_type == "application/x-ndjson"
+        mock_service.stream.assert_called_once_with(cursor=5)
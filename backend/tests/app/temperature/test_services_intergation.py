@@ -0,0 +1,83 @@
+"""Integration tests for the API temperature module services with real SQLite database.
+
+These tests verify the service layer works with actual database queries
+and transactions, using an in-memory SQLite database for fast testing.
+"""
+
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from app.api.temperature.schemas import TemperatureCreate, TemperatureFilter, TemperatureRead
+from app.api.temperature.services import TemperatureService
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Constants for testing
+BASE_TIMESTAMP = datetime(2025, 1, 1, 10, 0, tzinfo=UTC)
+
+
+@pytest_asyncio.fixture
+async def async_session_test() -> AsyncGenerator[AsyncSession]:
+    """Create an in-memory SQLite database for testing."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        echo=False,
+    )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    async_session = AsyncSession(engine, expire_on_commit=False)
+    yield async_session
+    await async_session.close()
+    await engine.dispose()
+
+
+class TestTemperatureServiceIntegration:
+    """Integration tests with real database."""
+
+    @pytest.mark.asyncio
+    async def test_gets_temperatures_filtered(self, async_session_test: AsyncSession) -> None:
+        """Test listing temperature records filtered by device and time range."""
+        service = TemperatureService(session=async_session_test)
+
+        created = await service.create_many(
+            [
+                TemperatureCreate(device_id="sensor-1", temperature=20.0, timestamp=BASE_TIMESTAMP),
+                TemperatureCreate(device_id="sensor-1", temperature=21.0, timestamp=BASE_TIMESTAMP + timedelta(hours=1)),
+                TemperatureCreate(device_id="sensor-1", temperature=22.0, timestamp=BASE_TIMESTAMP + timedelta(hours=2)),
+                TemperatureCreate(device_id="sensor-2", temperature=23.0, timestamp=BASE_TIMESTAMP + timedelta(hours=1)),
+            ]
+        )
+
+        by_device = await service.gets(filters=TemperatureFilter(device_id="sensor-2"))
+        assert [temperature.id for temperature in by_device] == [created[3].id]
+
+        since = await service.gets(filters=TemperatureFilter(device_id="sensor-1", since=BASE_TIMESTAMP + timedelta(hours=1)))
+        assert [temperature.id for temperature in since] == [created[1].id, created[2].id]
+
+        until = await service.gets(filters=TemperatureFilter(device_id="sensor-1", until=BASE_TIMESTAMP + timedelta(hours=1)))
+        assert [temperature.id for temperature in until] == [created[0].id, created[1].id]
+
+        window = await service.gets(filters=TemperatureFilter(since=BASE_TIMESTAMP + timedelta(hours=1), until=BASE_TIMESTAMP + timedelta(hours=1)))
+        assert [temperature.id for temperature in window] == [created[1].id, created[3].id]
+
+    @pytest.mark.asyncio
+    async def test_stream_temperatures(self, async_session_test: AsyncSession) -> None:
+        """Test streaming temperature records as newline-delimited JSON, ordered by ID and starting after a cursor."""
+        service = TemperatureService(session=async_session_test)
+
+        created = [
+            await service.create(TemperatureCreate(device_id=f"sensor-{index}", temperature=20.0 + index, timestamp=BASE_TIMESTAMP + timedelta(hours=index))) for index in range(3)
+        ]
+
+        lines = [line async for line in service.stream()]
+        assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in lines)
+        assert [TemperatureRead.model_validate_json(line) for line in lines] == created
+        assert [line async for line in service.stream(cursor=created[0].id)] == lines[1:]
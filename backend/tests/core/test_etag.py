@@ -0,0 +1,76 @@
+"""Tests for the ETag helpers of the backend core."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from app.core.etag import CACHE_CONTROL, compute_etag, etag_matches, json_response_with_etag
+from fastapi import Request, status
+
+CONTENT = b'{"id":1}'
+
+
+def make_request(headers: dict[str, str]) -> MagicMock:
+    """Create a mock request carrying the given headers."""
+    request = MagicMock(spec=Request)
+    request.headers = headers
+    return request
+
+
+class TestComputeEtag:
+    """Tests for compute_etag."""
+
+    def test_compute_etag_is_weak_and_quoted(self) -> None:
+        """Test that the ETag is a quoted weak validator."""
+        etag = compute_etag(CONTENT)
+
+        assert etag.startswith('W/"')
+        assert etag.endswith('"')
+
+    def test_compute_etag_depends_on_content(self) -> None:
+        """Test that the ETag is stable for a body and changes with it."""
+        assert compute_etag(CONTENT) == compute_etag(CONTENT)
+        assert compute_etag(CONTENT) != compute_etag(b'{"id":2}')
+
+
+class TestEtagMatches:
+    """Tests for etag_matches."""
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        [
+            compute_etag(CONTENT),
+            compute_etag(CONTENT).removeprefix("W/"),
+            f'"other", {compute_etag(CONTENT)}',
+            "*",
+        ],
+    )
+    def test_etag_matches(self, if_none_match: str) -> None:
+        """Test that matching, strong, listed and wildcard tags match."""
+        assert etag_matches(compute_etag(CONTENT), if_none_match)
+
+    @pytest.mark.parametrize("if_none_match", [None, "", '"other"'])
+    def test_etag_does_not_match(self, if_none_match: str | None) -> None:
+        """Test that missing or different tags do not match."""
+        assert not etag_matches(compute_etag(CONTENT), if_none_match)
+
+
+class TestJsonResponseWithEtag:
+    """Tests for json_response_with_etag."""
+
+    def test_response_carries_body_and_etag(self) -> None:
+        """Test that an unconditional request gets the body with its ETag."""
+        response = json_response_with_etag(make_request({}), CONTENT)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.body == CONTENT
+        assert response.media_type == "application/json"
+        assert response.headers["etag"] == compute_etag(CONTENT)
+        assert response.headers["cache-control"] == CACHE_CONTROL
+
+    def test_response_not_modified(self) -> None:
+        """Test that a matching If-None-Match gets an empty 304."""
+        response = json_response_with_etag(make_request({"if-none-match": compute_etag(CONTENT)}), CONTENT)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.body == b""
+        assert response.headers["etag"] == compute_etag(CONTENT)
@@ -0,0 +1 @@
+"""ELIMS - Backend MQTT Tests."""
@@ -0,0 +1,64 @@
+"""Tests for the MQTT subscriber of the backend."""
+
+from collections.abc import Callable
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+from app.mqtt import subscriber
+from app.mqtt.schemas import TELEMETRY_MESSAGE_ADAPTER
+from app.mqtt.subscriber import MQTTSubscriber
+from elims_common.mqtt.messages import MQTTLogMessages
+
+TOPIC = "devices/raspberry-1/telemetry"
+
+
+def subscribe_decoded(decode: Callable[[str], object]) -> tuple[MagicMock, MagicMock, Callable[[str, str], None]]:
+    """Subscribe a mock subscriber through _subscribe_decoded and return it with its callback and payload handler."""
+    mqtt_subscriber = MagicMock(spec=MQTTSubscriber)
+    mqtt_subscriber.msg = MagicMock(spec=MQTTLogMessages)
+    callback = MagicMock()
+
+    MQTTSubscriber._subscribe_decoded(mqtt_subscriber, TOPIC, decode, callback)  # noqa: SLF001
+
+    mqtt_subscriber.subscribe.assert_called_once()
+    return mqtt_subscriber, callback, mqtt_subscriber.subscribe.call_args.args[1]
+
+
+class TestSubscribeDecoded:
+    """Tests for the payload decoding of _subscribe_decoded."""
+
+    def test_valid_payload_is_passed_to_callback(self) -> None:
+        """Test that a decoded payload is passed to the callback."""
+        _, callback, handler = subscribe_decoded(TELEMETRY_MESSAGE_ADAPTER.validate_json)
+
+        handler(TOPIC, '{"temperature": 21.5}')
+
+        callback.assert_called_once()
+        assert callback.call_args.args[0] == TOPIC
+        assert callback.call_args.args[1].temperature == pytest.approx(21.5)
+
+    @pytest.mark.parametrize("decode", [orjson.loads, TELEMETRY_MESSAGE_ADAPTER.validate_json])
+    def test_invalid_json_is_logged(self, decode: Callable[[str], object]) -> None:
+        """Test that a payload which is not JSON is logged as invalid JSON and dropped."""
+        mqtt_subscriber, callback, handler = subscribe_decoded(decode)
+
+        with patch.object(subscriber, "logger") as mock_logger:
+            handler(TOPIC, "{not json")
+
+        mqtt_subscriber.msg.invalid_json_payload.assert_called_once_with(TOPIC, "{not json")
+        mqtt_subscriber.msg.invalid_payload_schema.assert_not_called()
+        mock_logger.error.assert_called_once_with(mqtt_subscriber.msg.invalid_json_payload.return_value)
+        callback.assert_not_called()
+
+    def test_schema_mismatch_is_logged(self) -> None:
+        """Test that a JSON payload not matching the telemetry schema is logged as a schema failure and dropped."""
+        mqtt_subscriber, callback, handler = subscribe_decoded(TELEMETRY_MESSAGE_ADAPTER.validate_json)
+
+        with patch.object(subscriber, "logger") as mock_logger:
+            handler(TOPIC, '{"temperature": "hot"}')
+
+        mqtt_subscriber.msg.invalid_payload_schema.assert_called_once_with(TOPIC, '{"temperature": "hot"}')
+        mqtt_subscriber.msg.invalid_json_payload.assert_not_called()
+        mock_logger.error.assert_called_once_with(mqtt_subscriber.msg.invalid_payload_schema.return_value)
+        callback.assert_not_called()
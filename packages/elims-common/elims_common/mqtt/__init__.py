@@ -1,7 +1,7 @@
 """ELIMS Common Package - MQTT Module."""
 
 from elims_common.mqtt.config import MQTTConfig
-from elims_common.mqtt.constants import MQTTConnectionFlags, MQTTReturnCode
+from elims_common.mqtt.constants import MQTT_LWT_OFFLINE_PAYLOAD, MQTTConnectionFlags, MQTTReturnCode
 from elims_common.mqtt.exceptions import (
     MQTTConnectionError,
     MQTTError,
@@ -12,6 +12,7 @@ from elims_common.mqtt.publisher import MQTTPublisher
 from elims_common.mqtt.subscriber import MQTTSubscriber
 
 __all__ = [
+    "MQTT_LWT_OFFLINE_PAYLOAD",
     "MQTTConfig",
     "MQTTConnectionError",
     "MQTTConnectionFlags",
@@ -1,7 +1,9 @@
 """ELIMS Common Package - MQTT Module - Client."""
 
+import socket
 import ssl
 from threading import Event
+from typing import TYPE_CHECKING
 
 import paho.mqtt.client as mqtt
 
@@ -11,6 +13,9 @@ from elims_common.mqtt.constants import MQTTConnectionFlags, MQTTReturnCode
 from elims_common.mqtt.exceptions import MQTTConnectionError
 from elims_common.mqtt.messages import MQTTLogMessages
 
+if TYPE_CHECKING:
+    from paho.mqtt.client import SocketLike
+
 
 class MQTTClient:
     """Base class for MQTT clients with common functionality."""
@@ -80,8 +85,23 @@ class MQTTClient:
         """Set up MQTT client callbacks. Override in subclasses to add more callbacks."""
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
+        self._client.on_socket_open = self._on_socket_open
         logger.debug(self.msg.setup_callbacks())
 
+    def _on_socket_open(self, _client: mqtt.Client, _userdata: object, sock: "SocketLike") -> None:
+        """Handle socket open callback by disabling Nagle's algorithm.
+
+        MQTT packets are small, so delaying them to coalesce with later writes only adds latency.
+
+        Args:
+            _client: MQTT client instance
+            _userdata: User data (unused)
+            sock: Socket connected to the broker (TLS wrapped, or a websocket wrapper without socket options)
+
+        """
+        if isinstance(sock, socket.socket):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     def _on_connect(self, _client: mqtt.Client | None, _userdata: object | None, flags: dict, rc: int) -> None:
         """Handle connection callback.
 
@@ -6,6 +6,8 @@ from pydantic import BaseModel
 
 MQTT_MAX_TOPIC_LENGTH = 65535
 
+MQTT_LWT_OFFLINE_PAYLOAD = b'{"status":"offline"}'
+
 
 class MQTTClientType:
     """Types of MQTT clients for logging purposes."""
@@ -59,6 +59,10 @@ class MQTTLogMessages:
         """Generate invalid JSON payload log message."""
         return f"[INVALID JSON] | TOPIC: {topic:<30} | PAYLOAD: {payload}"
 
+    def invalid_payload_schema(self, topic: str, payload: str) -> str:
+        """Generate invalid payload schema log message."""
+        return f"[INVALID SCHEMA] | TOPIC: {topic:<30} | PAYLOAD: {payload}"
+
     def subscribed(self, topic: str) -> str:
         """Generate subscribed log message."""
         return f"[SUBSCRIBE] | CLIENT: {self.config.client_type:<10} | TOPIC: {topic}"
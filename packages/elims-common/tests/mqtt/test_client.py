@@ -0,0 +1,24 @@
+"""Test ELIMS Common Package - MQTT Module - Client."""
+
+import socket
+from unittest.mock import MagicMock
+
+from elims_common.mqtt.client import MQTTClient
+
+
+def test_client_socket_open_disables_nagle() -> None:
+    """Test that TCP_NODELAY is set on the broker socket when it is opened."""
+    sock = MagicMock(spec=socket.socket)
+
+    MQTTClient._on_socket_open(MagicMock(spec=MQTTClient), None, None, sock)  # noqa: SLF001
+
+    sock.setsockopt.assert_called_once_with(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def test_client_socket_open_skips_non_tcp_socket() -> None:
+    """Test that socket options are left alone when the broker socket is not a TCP socket."""
+    sock = MagicMock()
+
+    MQTTClient._on_socket_open(MagicMock(spec=MQTTClient), None, None, sock)  # noqa: SLF001
+
+    sock.setsockopt.assert_not_called()
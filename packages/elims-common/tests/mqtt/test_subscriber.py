@@ -6,7 +6,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 from elims_common.mqtt.config import MQTTConfig
 from elims_common.mqtt.exceptions import MQTTConnectionError
-from elims_common.mqtt.subscriber import MQTTSubscriber
+from elims_common.mqtt.subscriber import MQTTSubscriber, compile_topic_filter
+from paho.mqtt.client import topic_matches_sub
 from pydantic import SecretStr
 
 # Constants for test configuration
@@ -322,3 +323,10 @@ def test_subscriber_payload_logging_enabled(_mock_client: Any) -> None:
 
     subscriber._on_message(None, None, mock_msg)  # noqa: SLF001
     callback.assert_called_once_with("test/topic", "A" * 100)
+
+
+@pytest.mark.parametrize("topic_filter", ["#", "+", "a/#", "a/+", "a/+/b", "+/b/#", "a/b", "$SYS/#", "a/b.c/+"])
+@pytest.mark.parametrize("topic", ["a", "a/", "a/b", "a/b/c", "/a", "$SYS/x", "a//b", "a/x/b", "x/b/y", "a/b.c/d", "a/bxc/d"])
+def test_compile_topic_filter_matches_like_paho(topic_filter: str, topic: str) -> None:
+    """Test that compiled topic filters match the same topics as paho's topic matcher."""
+    assert bool(compile_topic_filter(topic_filter).fullmatch(topic)) is topic_matches_sub(topic_filter, topic)
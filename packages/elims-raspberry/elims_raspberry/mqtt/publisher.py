@@ -1,17 +1,18 @@
 """ELIMS Raspberry Package - MQTT Module."""
 
-import json
-import time
+import signal
 from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import UTC, datetime
+from functools import lru_cache
+from threading import Event
 
 import adafruit_bmp280
 import adafruit_dht
 import board
-from app.config import settings
+from app.config import get_settings
 from elims_common.logger.logger import logger
-from elims_common.mqtt import MQTTConfig, MQTTPublisher
+from elims_common.mqtt import MQTT_LWT_OFFLINE_PAYLOAD, MQTTConfig, MQTTPublisher
 
 # ---------------------------------------------------------------------
 # MQTT CONFIG
@@ -19,21 +20,28 @@ from elims_common.mqtt import MQTTConfig, MQTTPublisher
 
 CLIENT_TYPE = "publisher"
 CLIENT_ID = f"elims-raspberry-01-{CLIENT_TYPE}"
-RASPBERRY_MQTT_CONFIG = MQTTConfig(
-    broker_host=settings.mqtt_host,
-    broker_port=settings.mqtt_port,
-    username=settings.mqtt_username,
-    password=settings.mqtt_password,
-    client_id=CLIENT_ID,
-    client_type=CLIENT_TYPE,
-    lwt_topic=f"elims/{CLIENT_ID}/status",
-    lwt_payload=json.dumps({"status": "offline"}),
-    keepalive=60,
-    reconnect_on_failure=True,
-    certificate_authority_file=settings.mqtt_certificate_authority_file,
-    certificate_file=settings.mqtt_certificate_file,
-    key_file=settings.mqtt_key_file,
-)
+PUBLISH_INTERVAL = 10
+
+
+@lru_cache(maxsize=1)
+def get_mqtt_config() -> MQTTConfig:
+    """Build the MQTT configuration of the raspberry publisher on first use."""
+    settings = get_settings()
+    return MQTTConfig(
+        broker_host=settings.mqtt_host,
+        broker_port=settings.mqtt_port,
+        username=settings.mqtt_username,
+        password=settings.mqtt_password,
+        client_id=CLIENT_ID,
+        client_type=CLIENT_TYPE,
+        lwt_topic=f"elims/{CLIENT_ID}/status",
+        lwt_payload=MQTT_LWT_OFFLINE_PAYLOAD,
+        keepalive=60,
+        reconnect_on_failure=True,
+        certificate_authority_file=settings.mqtt_certificate_authority_file,
+        certificate_file=settings.mqtt_certificate_file,
+        key_file=settings.mqtt_key_file,
+    )
 
 
 # ---------------------------------------------------------------------
@@ -44,10 +52,6 @@ RASPBERRY_MQTT_CONFIG = MQTTConfig(
 class RaspberryMQTTPublisher(MQTTPublisher):
     """Raspberry-specific MQTT Publisher."""
 
-    def __init__(self, config: MQTTConfig) -> None:
-        """Initialize publisher with environment defaults."""
-        super().__init__(config)
-
     def publish_raspberry_telemetry(self, sensor_id: str, data: dict[str, object]) -> None:
         """Publish raspberry telemetry data to a topic."""
         topic = f"devices/{self.config.client_id}/telemetry"
@@ -78,7 +82,12 @@ def mqtt_publisher(config: MQTTConfig) -> Generator[MQTTPublisher]:
 
 def main() -> None:
     """MQTT publisher."""
-    publisher = RaspberryMQTTPublisher(RASPBERRY_MQTT_CONFIG)
+    publisher = RaspberryMQTTPublisher(get_mqtt_config())
+    dht11: adafruit_dht.DHT11 | None = None
+
+    # Stop cleanly (publishing the offline status) on SIGTERM, e.g. when the service is stopped
+    stop_event = Event()
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: stop_event.set())
 
     try:
         publisher.connect()
@@ -88,7 +97,7 @@ def main() -> None:
         bmp280 = adafruit_bmp280.Adafruit_BMP280_I2C(i2c)
         dht11 = adafruit_dht.DHT11(board.D22)
 
-        while True:
+        while not stop_event.is_set():
             now = datetime.now(UTC)
             timestamp = now.strftime("%Y-%m-%dT%H:%M:%SZ")
 
@@ -114,12 +123,16 @@ def main() -> None:
             else:
                 logger.warning("No sensor data available, skipping publish cycle")
 
-            time.sleep(10)
+            # Sleep until the next cycle, waking up early only if a stop is requested
+            stop_event.wait(PUBLISH_INTERVAL)
 
     except KeyboardInterrupt:
         logger.warning("Shutdown requested by user")
 
     finally:
+        # Release the DHT11 GPIO pin, only if the sensor handle was created
+        if dht11 is not None:
+            dht11.exit()
         if publisher.is_connected:
             publisher.publish_raspberry_status("offline")
             publisher.disconnect()